@@ -1,3 +1,11 @@
+import multiprocessing
+import random
+import time
+
+import numpy as np
+
+from csp import CSP
+
 def is_safe(assignment, row, col):
     """
     Check if we can place a queen at (row, col) given the current assignment.
@@ -10,29 +18,33 @@ def is_safe(assignment, row, col):
             return False
     return True
 
-def backtrack(assignment):
+def backtrack(assignment, n=4, stats=None):
     """
     Backtracking CSP solver:
     - assignment: {row: col} for already placed queens
+    - n: board size
+    - stats: optional dict; stats["nodes"] counts queens placed
     """
-    if len(assignment) == 4:  # all 4 queens placed
+    if len(assignment) == n:  # all n queens placed
         return assignment
 
-    row = len(assignment)  # choose next row
-    for col in range(4):
+    row = next(r for r in range(n) if r not in assignment)  # choose next free row
+    for col in range(n):
         if is_safe(assignment, row, col):
             assignment[row] = col
-            result = backtrack(assignment)
+            if stats is not None:
+                stats["nodes"] = stats.get("nodes", 0) + 1
+            result = backtrack(assignment, n, stats)
             if result:
                 return result
             del assignment[row]  # backtrack
     return None
 
-def print_board(solution):
+def print_board(solution, n=4):
     """Pretty print the board with Q for queen and . for empty cell."""
-    for r in range(4):
+    for r in range(n):
         row = ""
-        for c in range(4):
+        for c in range(n):
             if solution.get(r) == c:
                 row += "Q "
             else:
@@ -40,18 +52,351 @@ def print_board(solution):
         print(row)
     print()
 
+# ----------- Bitmask N-queens -----------
+
+def _row_masks(n, assignment):
+    """
+    Per-row (fixed column or -1, mask of columns attacked by pre-placed
+    queens). Raises ValueError if the pre-placed queens are invalid.
+    """
+    fixed = [-1] * n
+    blocked = [0] * n
+    for r, c in (assignment or {}).items():
+        if not (0 <= r < n and 0 <= c < n):
+            raise ValueError(f"queen ({r}, {c}) is off the {n}x{n} board")
+        if not is_safe({row: col for row, col in assignment.items() if row != r}, r, c):
+            raise ValueError(f"queen ({r}, {c}) attacks another pre-placed queen")
+        fixed[r] = c
+        for row in range(n):
+            d = abs(row - r)
+            mask = 1 << c
+            if c + d < n:
+                mask |= 1 << (c + d)
+            if c - d >= 0:
+                mask |= 1 << (c - d)
+            blocked[row] |= mask
+    return fixed, blocked
+
+def _enumerate(n, row, cols, ld, rd, fixed, blocked, placed):
+    """
+    Depth-first search over rows. cols, ld and rd are bitmasks of the
+    columns attacked in this row by earlier queens along columns and the
+    two diagonals; shifting ld/rd by one per row moves the diagonals along.
+    """
+    if row == n:
+        yield dict(enumerate(placed))
+        return
+    full = (1 << n) - 1
+    free = ~(cols | ld | rd) & full
+    if fixed[row] >= 0:
+        avail = free & (1 << fixed[row])
+    else:
+        avail = free & ~blocked[row]
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        placed.append(bit.bit_length() - 1)
+        yield from _enumerate(n, row + 1, cols | bit, ((ld | bit) << 1) & full,
+                              (rd | bit) >> 1, fixed, blocked, placed)
+        placed.pop()
+
+def enumerate_solutions(n, assignment=None):
+    """Lazily yield every solution as {row: col}, honouring pre-placed queens."""
+    fixed, blocked = _row_masks(n, assignment)
+    return _enumerate(n, 0, 0, 0, 0, fixed, blocked, [])
+
+def solve_queens(n, assignment=None):
+    """First solution as {row: col}, or None."""
+    return next(enumerate_solutions(n, assignment), None)
+
+def _count(n, row, cols, ld, rd, fixed, blocked):
+    """(solutions, nodes) below a board with queens in rows 0 .. row-1."""
+    full = (1 << n) - 1
+    free = ~(cols | ld | rd) & full
+    if fixed[row] >= 0:
+        avail = free & (1 << fixed[row])
+    else:
+        avail = free & ~blocked[row]
+    if row == n - 1:
+        return avail.bit_count(), 1
+    total = 0
+    nodes = 1
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        solutions, below = _count(n, row + 1, cols | bit, ((ld | bit) << 1) & full,
+                                  (rd | bit) >> 1, fixed, blocked)
+        total += solutions
+        nodes += below
+    return total, nodes
+
+def _count_free(full, cols, ld, rd):
+    """_count for boards with no pre-placed queens: nothing but the masks."""
+    if cols == full:
+        return 1
+    avail = ~(cols | ld | rd) & full
+    total = 0
+    while avail:
+        bit = avail & -avail
+        avail ^= bit
+        total += _count_free(full, cols | bit, ((ld | bit) << 1) & full, (rd | bit) >> 1)
+    return total
+
+def _count_first_column(task):
+    """
+    Pool task: (solutions, nodes) for the row-0 queen in column `col`.
+    Free boards take the leaner _count_free, which counts no nodes (None),
+    unless `want_nodes` is set.
+    """
+    n, fixed, blocked, col, want_nodes = task
+    if n == 1:
+        return 1, 1
+    bit = 1 << col
+    if not any(blocked) and not want_nodes:
+        full = (1 << n) - 1
+        return _count_free(full, bit, (bit << 1) & full, bit >> 1), None
+    solutions, nodes = _count(n, 1, bit, (bit << 1) & ((1 << n) - 1), bit >> 1, fixed, blocked)
+    return solutions, nodes + 1
+
+def count_solutions(n, assignment=None, processes=None, stats=None):
+    """
+    Number of solutions. The work is split by the column of the row-0
+    queen and farmed out to a process pool (processes=1 runs in-process).
+    Without pre-placed queens the board's left-right mirror maps column c
+    to n-1-c, so only the left half of row 0 is searched and doubled.
+    If a dict is passed as `stats`, stats["nodes"] is set to the number of
+    partial boards searched (this takes the general, slightly slower path).
+    """
+    if stats is not None:
+        stats["nodes"] = 0
+    if n == 0:
+        return 1
+    fixed, blocked = _row_masks(n, assignment)
+    if fixed[0] >= 0:
+        columns = [(fixed[0], 1)]
+    elif not assignment:
+        columns = [(c, 2) for c in range(n // 2)]
+        if n % 2:
+            columns.append((n // 2, 1))
+    else:
+        columns = [(c, 1) for c in range(n) if not blocked[0] >> c & 1]
+
+    tasks = [(n, fixed, blocked, c, stats is not None) for c, _ in columns]
+    if processes == 1 or len(tasks) < 2:
+        results = list(map(_count_first_column, tasks))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            results = pool.map(_count_first_column, tasks, chunksize=1)
+    if stats is not None:
+        stats["nodes"] = sum(nodes for _, nodes in results)
+    return sum(w * k for (_, w), (k, _) in zip(columns, results))
+
+# ----------- N-queens on the generic CSP engine -----------
+
+def queens_csp(n, assignment=None):
+    """CSP with one variable per row (value = column); pre-placed rows get one value."""
+    assignment = assignment or {}
+    csp = CSP()
+    for row in range(n):
+        csp.add_variable(row, [assignment[row]] if row in assignment else range(n))
+    for r1 in range(n):
+        for r2 in range(r1 + 1, n):
+            csp.add_constraint(r1, r2, lambda c1, c2, d=r2 - r1: c1 != c2 and abs(c1 - c2) != d)
+    return csp
+
+def solve_queens_csp(n, assignment=None, stats=None, **options):
+    """
+    Solve with the CSP engine; options are passed to CSP.solve (ac3,
+    forward_check, mrv, lcv, backjump). Node counts go into `stats`.
+    """
+    csp = queens_csp(n, assignment)
+    solution = csp.solve(**options)
+    if stats is not None:
+        stats.update(csp.stats)
+    return solution
+
+def benchmark_csp(sizes=(4, 8, 12, 16, 20)):
+    """Nodes and seconds to the first solution: plain backtrack vs the CSP engine."""
+    print(f"{'N':>4} {'backtrack nodes':>16} {'time':>8} {'CSP nodes':>10} {'time':>8}")
+    for n in sizes:
+        old = {}
+        t0 = time.perf_counter()
+        backtrack({}, n, old)
+        t1 = time.perf_counter()
+        new = {}
+        solve_queens_csp(n, stats=new)
+        t2 = time.perf_counter()
+        print(f"{n:>4} {old.get('nodes', 0):>16} {t1 - t0:>8.3f} {new['nodes']:>10} {t2 - t1:>8.3f}")
+
+# ----------- Min-conflicts local search (very large N) -----------
+
+def _check_preplaced(n, assignment):
+    placed = {}
+    for r, c in assignment.items():
+        if not (0 <= r < n and 0 <= c < n):
+            raise ValueError(f"queen ({r}, {c}) is off the {n}x{n} board")
+        if not is_safe(placed, r, c):
+            raise ValueError(f"queen ({r}, {c}) attacks another pre-placed queen")
+        placed[r] = c
+
+def _greedy_columns(n, assignment, rng, tries=128):
+    """
+    Row-by-row greedy start: every free row takes a column nobody uses yet
+    (so columns never conflict), preferring one whose two diagonals are
+    still empty among up to `tries` random picks.
+    """
+    placed = [-1] * n
+    used = bytearray(n)
+    diag1 = bytearray(2 * n - 1)   # r + c
+    diag2 = bytearray(2 * n - 1)   # r - c + n - 1
+    for r, c in assignment.items():
+        placed[r] = c
+        used[c] = 1
+        diag1[r + c] = diag2[r - c + n - 1] = 1
+    pool = [c for c in range(n) if not used[c]]
+    rng.shuffle(pool)
+    rand = rng.random
+    offset = n - 1
+    for r in range(n):
+        if placed[r] >= 0:
+            continue
+        m = len(pool)
+        pick = m - 1
+        for _ in range(min(tries, m)):
+            i = int(rand() * m)
+            c = pool[i]
+            if not diag1[r + c] and not diag2[r - c + offset]:
+                pick = i
+                break
+        c = pool[pick]
+        pool[pick] = pool[-1]
+        pool.pop()
+        placed[r] = c
+        diag1[r + c] = diag2[r - c + offset] = 1
+    return np.array(placed, dtype=np.int64)
+
+def verify_queens(cols, assignment=None):
+    """True if cols (row -> column array) is a valid placement keeping the pre-placed queens."""
+    cols = np.asarray(cols)
+    n = len(cols)
+    rows = np.arange(n)
+    if cols.min(initial=0) < 0 or cols.max(initial=0) >= n:
+        return False
+    if any(cols[r] != c for r, c in (assignment or {}).items()):
+        return False
+    return (len(np.unique(cols)) == n and len(np.unique(rows + cols)) == n
+            and len(np.unique(rows - cols)) == n)
+
+def min_conflicts(n, assignment=None, max_steps=None, restarts=10, seed=None, stats=None,
+                  sideways=0.3, noise=0.1):
+    """
+    Min-conflicts local search for large N. Starts from the greedy
+    placement, which is a permutation: every column holds one queen, so
+    only the diagonals can conflict. A move swaps the columns of a random
+    conflicted queen and a random partner, keeping the swap if it lowers
+    the number of attacks, or with probability `sideways` if it leaves it
+    unchanged. When no partner is accepted, a random swap is made with
+    probability `noise`, so the search can leave local minima. Diagonal
+    occupancy is held in NumPy count arrays, updated in O(1) per move and
+    scanned in one vectorized pass to list the conflicted queens. Pre-placed
+    queens never move. Each restart gets `max_steps` moves (default
+    n // 10 + 1000).
+
+    Returns the row -> column array, or None if every restart runs out.
+    """
+    assignment = assignment or {}
+    _check_preplaced(n, assignment)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+    rng = random.Random(seed)
+    if max_steps is None:
+        max_steps = n // 10 + 1000
+    fixed = np.zeros(n, dtype=bool)
+    fixed[list(assignment)] = True
+    movable = np.flatnonzero(~fixed)
+    rows = np.arange(n)
+    offset = n - 1
+    if stats is not None:
+        stats.update(steps=0, restarts=0)
+    if len(movable) < 2:
+        cols = _greedy_columns(n, assignment, rng)
+        return cols if verify_queens(cols, assignment) else None
+
+    for attempt in range(restarts):
+        cols = _greedy_columns(n, assignment, rng)
+        diag1 = np.bincount(rows + cols, minlength=2 * n - 1)
+        diag2 = np.bincount(rows - cols + offset, minlength=2 * n - 1)
+        place = cols.tolist()
+        steps = 0
+
+        def attacks(r, c):
+            return int(diag1[r + c]) + int(diag2[r - c + offset]) - 2
+
+        def move(r, old, new):
+            diag1[r + old] -= 1
+            diag2[r - old + offset] -= 1
+            diag1[r + new] += 1
+            diag2[r - new + offset] += 1
+            place[r] = new
+
+        while steps < max_steps:
+            attacked = diag1[rows + cols] + diag2[rows - cols + offset] > 2
+            if not attacked.any():
+                if stats is not None:
+                    stats["steps"] += steps
+                return cols
+            conflicted = np.flatnonzero(attacked & ~fixed).tolist()
+            if not conflicted:
+                break  # only pre-placed queens are attacked: restart
+            rng.shuffle(conflicted)
+            for r in conflicted:
+                if attacks(r, place[r]) == 0:
+                    continue  # fixed by an earlier move
+                for _ in range(64):
+                    j = int(movable[int(rng.random() * len(movable))])
+                    a, b = place[r], place[j]
+                    if j == r:
+                        continue
+                    before = attacks(r, a) + attacks(j, b)
+                    move(r, a, b)
+                    move(j, b, a)
+                    after = attacks(r, b) + attacks(j, a)
+                    if after < before or (after == before and rng.random() < sideways):
+                        cols[r], cols[j] = b, a
+                        break
+                    move(j, a, b)
+                    move(r, b, a)
+                else:
+                    if rng.random() < noise:  # random walk out of a local minimum
+                        j = int(movable[int(rng.random() * len(movable))])
+                        if j != r:
+                            a, b = place[r], place[j]
+                            move(r, a, b)
+                            move(j, b, a)
+                            cols[r], cols[j] = b, a
+                steps += 1
+                if steps >= max_steps:
+                    break
+        if stats is not None:
+            stats["steps"] += steps
+            stats["restarts"] = attempt + 1
+    return None
+
 def main():
-    print("4-Queens Problem with User Input")
+    print("N-Queens Problem with User Input")
+    n = int(input("Board size N (default 4): ") or "4")
     assignment = {}
 
     # Step 1: Take user input for initial queens
-    n = int(input("How many queens do you want to pre-place? (0 to 3): ") or "0")
-    for _ in range(n):
+    n_pre = int(input(f"How many queens do you want to pre-place? (0 to {n - 1}): ") or "0")
+    for _ in range(n_pre):
         while True:
             try:
-                row = int(input("Enter row (0-3): "))
-                col = int(input("Enter column (0-3): "))
-                if row in assignment:
+                row = int(input(f"Enter row (0-{n - 1}): "))
+                col = int(input(f"Enter column (0-{n - 1}): "))
+                if not (0 <= row < n and 0 <= col < n):
+                    print("That square is off the board!")
+                elif row in assignment:
                     print("There is already a queen in this row! Choose another row.")
                 elif not is_safe(assignment, row, col):
                     print("This position conflicts with existing queens! Choose another position.")
@@ -59,14 +404,16 @@ def main():
                     assignment[row] = col
                     break
             except ValueError:
-                print("Invalid input. Please enter integers between 0 and 3.")
+                print(f"Invalid input. Please enter integers between 0 and {n - 1}.")
 
     print("\nStarting CSP solver...")
-    solution = backtrack(assignment.copy())
+    solution = solve_queens(n, assignment)
 
     if solution:
         print("\nSolution found:")
-        print_board(solution)
+        print_board(solution, n)
+        if input("Count all solutions? (y/N): ").strip().lower() == "y":
+            print("Total solutions:", count_solutions(n, assignment))
     else:
         print("\nNo solution possible with given pre-placed queens.")
 
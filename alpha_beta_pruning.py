@@ -3,14 +3,25 @@ alpha_beta_demo.py
 
 Beginner-friendly alpha-beta pruning demo.
 - User inputs branching factor (b) and depth (d).
-- The program expects b**d leaf values (space-separated). Press Enter to use a small default example.
+- The program expects b**d leaf values (space-separated). Press Enter to use a small default example,
+  or type @path to search a binary file of fixed-width ints (see write_leaf_file) without loading it.
 - The program prints alpha/beta at every visited node and announces prunes.
 - It also reports how many leaf nodes were skipped (pruned).
+- alpha_beta_flat is the quiet engine behind it: it searches the flat leaf
+  list by index arithmetic and narrates only through an optional tracer.
+- ENGINES offers alpha-beta, PVS (NegaScout) and MTD(f) on the same leaves;
+  benchmark_engines compares them on random, best- and worst-ordered trees.
 """
 
+import array
 import math
+import mmap
+import multiprocessing
+import os
 import random
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 def build_tree_from_leaves(leaves, branching, depth):
     """
@@ -83,6 +94,413 @@ def alpha_beta(node, depth, alpha, beta, maximizing_player, path, prune_counter)
                 return value
         return value
 
+def print_tracer(event, level, path, **info):
+    """Tracer that prints the same narration as alpha_beta."""
+    indent = "    " * level
+    kind = "MAX" if info.get("maximizing") else "MIN"
+    if event == "leaf":
+        print(f"{indent}Leaf {path}: value = {info['value']}")
+    elif event == "enter":
+        print(f"{indent}{kind} {path}: alpha={info['alpha']}, beta={info['beta']}")
+    elif event == "return":
+        print(f"{indent}  Returned from {path + [info['child']]}: {info['value']}")
+    elif event == "update":
+        print(f"{indent}  Updated {kind} {path}: best={info['value']}, alpha={info['alpha']}, beta={info['beta']}")
+    elif event == "prune":
+        print(f"{indent}  PRUNE at {kind} {path}! Skipping {info['skipped']} remaining leaves")
+
+def alpha_beta_flat(leaves, branching, depth, tracer=None):
+    """
+    Quiet alpha-beta straight over the flat leaf array (root is MAX).
+    Node `index` at `level` has children index*b .. index*b + b-1 on the
+    next level, so leaves[index] is read directly at the bottom and a cut
+    after child i skips (b - i - 1) * b**(levels below the children) leaves.
+    `tracer(event, level, path, **info)` is called only if given; pass
+    print_tracer for the narrated output.
+    Returns (root value, number of pruned leaves).
+    """
+    if len(leaves) != branching ** depth:
+        raise ValueError("Number of leaves must be branching ** depth.")
+    child_leaves = [branching ** (depth - level - 1) for level in range(depth)]
+    pruned = 0
+    path = []
+
+    def search(level, index, alpha, beta, maximizing):
+        nonlocal pruned
+        if level == depth:
+            if tracer:
+                tracer("leaf", level, path, value=leaves[index])
+            return leaves[index]
+
+        if tracer:
+            tracer("enter", level, path, maximizing=maximizing, alpha=alpha, beta=beta)
+        value = -math.inf if maximizing else math.inf
+        first = index * branching
+        for i in range(branching):
+            if tracer:
+                path.append(i)
+            child_value = search(level + 1, first + i, alpha, beta, not maximizing)
+            if tracer:
+                path.pop()
+                tracer("return", level, path, child=i, value=child_value)
+            if maximizing:
+                if child_value > value:
+                    value = child_value
+                if value > alpha:
+                    alpha = value
+            else:
+                if child_value < value:
+                    value = child_value
+                if value < beta:
+                    beta = value
+            if tracer:
+                tracer("update", level, path, maximizing=maximizing, value=value, alpha=alpha, beta=beta)
+            if alpha >= beta:
+                skipped = (branching - i - 1) * child_leaves[level]
+                pruned += skipped
+                if tracer:
+                    tracer("prune", level, path, maximizing=maximizing, skipped=skipped)
+                return value
+        return value
+
+    return search(0, 0, -math.inf, math.inf, True), pruned
+
+def write_leaf_file(path, leaves, typecode="i"):
+    """Write leaves as fixed-width native-endian ints ('i' = 32-bit, 'q' = 64-bit)."""
+    with open(path, "wb") as f:
+        array.array(typecode, leaves).tofile(f)
+
+def alpha_beta_file(path, branching, depth=None, typecode="i", tracer=None):
+    """
+    alpha_beta_flat over a leaf file written by write_leaf_file, without
+    loading it. The file is memory-mapped and read through a typed
+    memoryview, so leaves are fetched left to right as the search reaches
+    them and the pages of pruned subtrees are never touched. Memory use is
+    constant apart from the recursion of depth `depth`, which is derived
+    from the file size when not given.
+    Returns (root value, number of pruned leaves).
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        width = array.array(typecode).itemsize
+        if size == 0 or size % width:
+            raise ValueError(f"{path} does not hold whole {width}-byte leaves.")
+        count = size // width
+        if depth is None:
+            depth = round(math.log(count, branching))
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mm, "madvise"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    view = memoryview(mm).cast(typecode)
+    try:
+        return alpha_beta_flat(view, branching, depth, tracer)
+    finally:
+        view.release()
+        mm.close()
+
+def search_subtree(leaves, branching, depth, level, index, maximizing, alpha=-math.inf, beta=math.inf, bounds=None):
+    """
+    Quiet alpha-beta below node (level, index) that also counts the leaves it
+    evaluates. If `bounds` (a shared [alpha, beta] array) is given, the
+    window is narrowed with it at every node, so a sibling's result seen by
+    the coordinator tightens this search immediately.
+    Returns (value, leaves visited).
+    """
+    visited = 0
+
+    def search(level, index, alpha, beta, maximizing):
+        nonlocal visited
+        if level == depth:
+            visited += 1
+            return leaves[index]
+        if bounds is not None:
+            if bounds[0] > alpha:
+                alpha = bounds[0]
+            if bounds[1] < beta:
+                beta = bounds[1]
+            if alpha >= beta:
+                return alpha if maximizing else beta  # parent already cut off
+        value = -math.inf if maximizing else math.inf
+        first = index * branching
+        for i in range(branching):
+            child_value = search(level + 1, first + i, alpha, beta, not maximizing)
+            if maximizing:
+                value = max(value, child_value)
+                alpha = max(alpha, value)
+            else:
+                value = min(value, child_value)
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+        return value
+
+    return search(level, index, alpha, beta, maximizing), visited
+
+# Per-process state of the parallel search workers
+_worker = {}
+
+def _init_worker(leaves, branching, depth, bounds):
+    _worker.update(leaves=leaves, branching=branching, depth=depth, bounds=bounds)
+
+def _search_task(level, index, maximizing):
+    w = _worker
+    return search_subtree(w["leaves"], w["branching"], w["depth"], level, index, maximizing, bounds=w["bounds"])
+
+def alpha_beta_parallel(leaves, branching, depth, workers=None, split_levels=2):
+    """
+    Young Brothers Wait parallel alpha-beta (root is MAX).
+
+    Along the leftmost path, down to `split_levels`, the first child of each
+    node is searched first (serially) to establish a bound; the remaining
+    siblings are then searched at once on a process pool. The node's
+    current alpha/beta live in a shared-memory array that every worker
+    reads at each node, so a sibling's improvement tightens all running
+    searches, and a cutoff closes the window so they stop right away.
+    Returns (root value, pruned leaves) where pruned leaves are those never
+    evaluated, as in alpha_beta_flat.
+    """
+    if len(leaves) != branching ** depth:
+        raise ValueError("Number of leaves must be branching ** depth.")
+    bounds = multiprocessing.RawArray("d", [-math.inf, math.inf])
+    visited = 0
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(leaves, branching, depth, bounds)) as pool:
+
+        def ybw(level, index, alpha, beta, maximizing):
+            nonlocal visited
+            if level >= split_levels or level == depth:
+                value, count = search_subtree(leaves, branching, depth, level, index, maximizing, alpha, beta)
+                visited += count
+                return value
+
+            first = index * branching
+            value = ybw(level + 1, first, alpha, beta, not maximizing)
+            if maximizing:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta or branching == 1:
+                return value
+
+            bounds[0], bounds[1] = alpha, beta
+            futures = [pool.submit(_search_task, level + 1, first + i, not maximizing)
+                       for i in range(1, branching)]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                child_value, count = future.result()
+                visited += count
+                if alpha >= beta:
+                    continue  # already cut off; result was searched with a closed window
+                if maximizing:
+                    value = max(value, child_value)
+                    alpha = max(alpha, value)
+                else:
+                    value = min(value, child_value)
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    bounds[0], bounds[1] = math.inf, -math.inf  # stop the other brothers
+                    for other in futures:
+                        other.cancel()
+                else:
+                    bounds[0], bounds[1] = alpha, beta
+            return value
+
+        value = ybw(0, 0, -math.inf, math.inf, True)
+
+    return value, branching ** depth - visited
+
+def compare_parallel(leaves, branching, depth, workers=None, split_levels=2):
+    """Run the serial and parallel engines on the same leaves and report speedup and search overhead."""
+    start = time.perf_counter()
+    serial_value, serial_pruned = alpha_beta_flat(leaves, branching, depth)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel_value, parallel_pruned = alpha_beta_parallel(leaves, branching, depth, workers, split_levels)
+    parallel_time = time.perf_counter() - start
+
+    total = branching ** depth
+    serial_leaves, parallel_leaves = total - serial_pruned, total - parallel_pruned
+    return {
+        "value": serial_value,
+        "values_match": serial_value == parallel_value,
+        "serial_time": serial_time,
+        "parallel_time": parallel_time,
+        "speedup": serial_time / parallel_time,
+        "serial_leaves": serial_leaves,
+        "parallel_leaves": parallel_leaves,
+        "search_overhead": parallel_leaves / serial_leaves - 1,
+    }
+
+# ----------- Alternative engines and benchmark -----------
+# Each engine takes (leaves, branching, depth) and returns
+# (root value, {"leaves": leaf evaluations, "nodes": interior nodes expanded}).
+# PVS and MTD(f) use null windows of width 1, so leaves must be integers.
+
+def alpha_beta_counted(leaves, branching, depth):
+    """Plain fail-hard alpha-beta with a full window, counting work."""
+    stats = {"leaves": 0, "nodes": 0}
+
+    def search(level, index, alpha, beta, maximizing):
+        if level == depth:
+            stats["leaves"] += 1
+            return leaves[index]
+        stats["nodes"] += 1
+        first = index * branching
+        for i in range(branching):
+            value = search(level + 1, first + i, alpha, beta, not maximizing)
+            if maximizing:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                break
+        return alpha if maximizing else beta
+
+    return search(0, 0, -math.inf, math.inf, True), stats
+
+def pvs(leaves, branching, depth):
+    """
+    Principal-variation search (NegaScout): the first child gets the full
+    window, later children a null window around alpha, and only a child
+    that fails high inside the window is searched again.
+    """
+    stats = {"leaves": 0, "nodes": 0}
+
+    def search(level, index, alpha, beta, color):
+        if level == depth:
+            stats["leaves"] += 1
+            return color * leaves[index]
+        stats["nodes"] += 1
+        first = index * branching
+        for i in range(branching):
+            if i == 0:
+                score = -search(level + 1, first, -beta, -alpha, -color)
+            else:
+                score = -search(level + 1, first + i, -alpha - 1, -alpha, -color)
+                if alpha < score < beta:
+                    score = -search(level + 1, first + i, -beta, -score, -color)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+        return alpha
+
+    return search(0, 0, -math.inf, math.inf, 1), stats
+
+def mtdf(leaves, branching, depth, first_guess=0):
+    """
+    MTD(f): converge on the root value with a sequence of null-window
+    alpha-beta searches that share a transposition table of lower/upper
+    bounds per node, so repeated passes re-read little of the tree.
+    """
+    stats = {"leaves": 0, "nodes": 0}
+    table = {}  # (level, index) -> [lower, upper]
+
+    def search(level, index, alpha, beta, maximizing):
+        key = (level, index)
+        bound = table.get(key)
+        if bound is not None:
+            if bound[0] >= beta:
+                return bound[0]
+            if bound[1] <= alpha:
+                return bound[1]
+            alpha, beta = max(alpha, bound[0]), min(beta, bound[1])
+        if level == depth:
+            stats["leaves"] += 1
+            g = leaves[index]
+        else:
+            stats["nodes"] += 1
+            first = index * branching
+            if maximizing:
+                g, a = -math.inf, alpha
+                for i in range(branching):
+                    if g >= beta:
+                        break
+                    g = max(g, search(level + 1, first + i, a, beta, False))
+                    a = max(a, g)
+            else:
+                g, b = math.inf, beta
+                for i in range(branching):
+                    if g <= alpha:
+                        break
+                    g = min(g, search(level + 1, first + i, alpha, b, True))
+                    b = min(b, g)
+        if bound is None:
+            bound = table[key] = [-math.inf, math.inf]
+        if g <= alpha:
+            bound[1] = g
+        elif g >= beta:
+            bound[0] = g
+        else:
+            bound[0] = bound[1] = g
+        return g
+
+    g = first_guess
+    lower, upper = -math.inf, math.inf
+    while lower < upper:
+        beta = g + 1 if g == lower else g
+        g = search(0, 0, beta - 1, beta, True)
+        if g < beta:
+            upper = g
+        else:
+            lower = g
+    return g, stats
+
+ENGINES = {
+    "alpha-beta": alpha_beta_counted,
+    "pvs": pvs,
+    "mtdf": mtdf,
+}
+
+def order_leaves(leaves, branching, depth, best_first=True):
+    """
+    Reorder a tree so every node lists its best child first (or last, for
+    best_first=False). Uses build_tree_from_leaves and flattens the result.
+    """
+    def arrange(node, maximizing):
+        if not isinstance(node, list):
+            return node, node
+        scored = [arrange(child, not maximizing) for child in node]
+        scored.sort(key=lambda pair: pair[0], reverse=maximizing == best_first)
+        value = scored[0][0] if best_first else scored[-1][0]
+        return value, [child for _, child in scored]
+
+    def flatten(node, out):
+        if isinstance(node, list):
+            for child in node:
+                flatten(child, out)
+        else:
+            out.append(node)
+        return out
+
+    _, tree = arrange(build_tree_from_leaves(leaves, branching, depth), True)
+    return flatten(tree, []) if isinstance(tree, list) else [tree]
+
+def benchmark_engines(branching, depth, seed=0, low=-1000, high=1000):
+    """
+    Compare every engine in ENGINES on random, best-ordered and
+    worst-ordered versions of one seeded random tree. Prints a table and
+    returns the rows as dicts.
+    """
+    rng = random.Random(seed)
+    leaves = [rng.randint(low, high) for _ in range(branching ** depth)]
+    trees = {
+        "random": leaves,
+        "best-ordered": order_leaves(leaves, branching, depth, best_first=True),
+        "worst-ordered": order_leaves(leaves, branching, depth, best_first=False),
+    }
+    rows = []
+    print(f"{'tree':<14}{'engine':<12}{'value':>8}{'leaves':>10}{'nodes':>10}{'time (s)':>10}")
+    for tree_name, tree_leaves in trees.items():
+        for engine_name, engine in ENGINES.items():
+            start = time.perf_counter()
+            value, stats = engine(tree_leaves, branching, depth)
+            elapsed = time.perf_counter() - start
+            rows.append({"tree": tree_name, "engine": engine_name, "value": value, "time": elapsed, **stats})
+            print(f"{tree_name:<14}{engine_name:<12}{value:>8}{stats['leaves']:>10}{stats['nodes']:>10}{elapsed:>10.4f}")
+    return rows
+
 
 def main():
     print("Alpha-Beta Pruning Demo (complete tree).")
@@ -99,7 +517,18 @@ def main():
 
     leaves_needed = b ** d
     print(f"\nThis tree will require {leaves_needed} leaf values (b**d = {b}^{d}).")
-    raw = input(f"Enter {leaves_needed} integer leaf values separated by space, or press Enter to use a default example: ").strip()
+    raw = input(f"Enter {leaves_needed} integer leaf values separated by space, @file for a binary leaf file, or press Enter to use a default example: ").strip()
+
+    if raw.startswith("@"):
+        print("\nStarting alpha-beta search over the leaf file (root is a MAX node).")
+        try:
+            best_value, pruned = alpha_beta_file(raw[1:], b, d)
+        except (OSError, ValueError) as exc:
+            print(f"Could not search leaf file: {exc}")
+            return
+        print(f"Minimax value at root: {best_value}")
+        print(f"Total pruned leaf nodes: {pruned}")
+        return
 
     if raw == "":
         # default example used for demonstration
@@ -121,15 +550,21 @@ def main():
             print("All leaf values should be integers.")
             return
 
-    # Build tree
-    root = build_tree_from_leaves(leaves, b, d)
+    engine = input(f"Search engine ({', '.join(ENGINES)}), or press Enter for the narrated alpha-beta: ").strip()
+    if engine:
+        if engine not in ENGINES:
+            print(f"Unknown engine {engine!r}.")
+            return
+        best_value, stats = ENGINES[engine](leaves, b, d)
+        print(f"\nMinimax value at root: {best_value}")
+        print(f"Leaves evaluated: {stats['leaves']}, interior nodes expanded: {stats['nodes']}")
+        return
 
     print("\nStarting alpha-beta search (root is a MAX node).")
-    prune_counter = {"count": 0}
-    best_value = alpha_beta(root, depth=0, alpha=-math.inf, beta=math.inf, maximizing_player=True, path=[], prune_counter=prune_counter)
+    best_value, pruned = alpha_beta_flat(leaves, b, d, tracer=print_tracer)
     print("\nSearch complete.")
     print(f"Minimax value at root: {best_value}")
-    print(f"Total pruned leaf nodes: {prune_counter['count']}")
+    print(f"Total pruned leaf nodes: {pruned}")
 
 if __name__ == "__main__":
     main()
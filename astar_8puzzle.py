@@ -1,4 +1,6 @@
 import heapq
+import math
+import mmap
 
 # Manhattan distance heuristic
 def manhattan(state, goal):
@@ -26,27 +28,332 @@ def get_neighbors(state):
             neighbors.append((tuple(new_state), action))
     return neighbors
 
-def astar(start, goal):
-    pq = []
-    heapq.heappush(pq, (manhattan(start, goal), 0, start, [], []))
-    visited = set()
+# -------- Compact engine --------
+# A state is packed into one int, 4 bits per board position: the tile at
+# position i lives in bits 4*i .. 4*i+3 (0 is the blank).
+
+DIRECTIONS = [(-1, 0, "Up"), (1, 0, "Down"), (0, -1, "Left"), (0, 1, "Right")]
+
+def build_move_table():
+    """MOVES[blank] -> list of (new blank position, action name)."""
+    table = []
+    for idx in range(9):
+        x, y = divmod(idx, 3)
+        moves = []
+        for dx, dy, action in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < 3 and 0 <= ny < 3:
+                moves.append((nx * 3 + ny, action))
+        table.append(moves)
+    return table
+
+MOVES = build_move_table()
+
+# Action for a blank displacement of new_index - old_index
+DELTA_ACTION = {-3: "Up", 3: "Down", -1: "Left", 1: "Right"}
+
+def pack(state):
+    """Pack a 9-tuple into a single int."""
+    code = 0
+    for i, tile in enumerate(state):
+        code |= tile << (4 * i)
+    return code
+
+def unpack(code):
+    """Inverse of pack()."""
+    return tuple((code >> (4 * i)) & 15 for i in range(9))
+
+def distance_table(goal):
+    """table[tile][pos] = Manhattan distance of `tile` at `pos` from its goal square."""
+    table = [[0] * 9 for _ in range(9)]
+    for tile in range(1, 9):
+        gx, gy = divmod(goal.index(tile), 3)
+        for pos in range(9):
+            x, y = divmod(pos, 3)
+            table[tile][pos] = abs(x - gx) + abs(y - gy)
+    return table
+
+def astar(start, goal, stats=None):
+    """
+    A* with the Manhattan heuristic on packed states.
+
+    The frontier holds (f, h, state, blank) ints only; the path is rebuilt
+    once from a parent-pointer dict at the end, and h is updated from the one
+    tile that moves. Returns (path, moves) like before, or (None, None).
+    If a dict is passed as `stats`, stats["expanded"] is set.
+    """
+    table = distance_table(goal)
+    goal_code = pack(goal)
+    start_code = pack(start)
+    h0 = sum(table[t][i] for i, t in enumerate(start) if t)
+
+    parent = {start_code: None}
+    best_g = {start_code: 0}
+    pq = [(h0, h0, start_code, start.index(0))]
+    push, pop = heapq.heappush, heapq.heappop
+    expanded = 0
 
     while pq:
-        f, g, state, path, moves = heapq.heappop(pq)
+        f, h, code, blank = pop(pq)
+        g = f - h
+        if g > best_g[code]:
+            continue  # stale entry
+        if code == goal_code:
+            break
+        expanded += 1
+        ng = g + 1
+        for nb, _ in MOVES[blank]:
+            tile = (code >> (4 * nb)) & 15
+            ncode = code - (tile << (4 * nb)) + (tile << (4 * blank))
+            if ng < best_g.get(ncode, ng + 1):
+                best_g[ncode] = ng
+                parent[ncode] = code
+                nh = h - table[tile][nb] + table[tile][blank]
+                push(pq, (ng + nh, nh, ncode, nb))
+    else:
+        if stats is not None:
+            stats["expanded"] = expanded
+        return None, None
+
+    if stats is not None:
+        stats["expanded"] = expanded
+
+    codes = []
+    while code is not None:
+        codes.append(code)
+        code = parent[code]
+    codes.reverse()
+    path = [unpack(c) for c in codes]
+    moves = []
+    for prev, cur in zip(path, path[1:]):
+        moves.append(DELTA_ACTION[cur.index(0) - prev.index(0)])
+    return path, moves
+
+# -------- Perfect distance table --------
+# A board is indexed by its blank square and the Lehmer rank of the order in
+# which the 8 tiles appear. Swapping the last two tiles in that order flips
+# the inversion parity and changes the rank by exactly one, so rank // 2
+# numbers the 8!/2 orders of the solvable parity class: 9 * 20160 = 181,440.
+
+TABLE_MAGIC = b"P8DT"
+TABLE_SIZE = 181440
+FACTORIALS = [5040, 720, 120, 24, 6, 2, 1, 1]
+
+def lehmer_rank(tiles):
+    """Rank of a permutation of 8 tiles in lexicographic order (0 .. 8!-1)."""
+    rank = 0
+    for i in range(7):
+        tile = tiles[i]
+        smaller = 0
+        for j in range(i + 1, 8):
+            if tiles[j] < tile:
+                smaller += 1
+        rank += smaller * FACTORIALS[i]
+    return rank
+
+def table_index(state):
+    """Slot of a 3x3 board in the perfect distance table."""
+    return state.index(0) * 20160 + (lehmer_rank([t for t in state if t]) >> 1)
+
+def inversion_parity(state):
+    """Parity of the number of inverted tile pairs (blank ignored)."""
+    tiles = [t for t in state if t]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    return inversions % 2
+
+def is_solvable(start, goal):
+    """On a 3-wide board moves never change the inversion parity."""
+    return sorted(start) == sorted(goal) and inversion_parity(start) == inversion_parity(goal)
+
+def build_perfect_table(goal):
+    """BFS from `goal`; table[table_index(s)] = optimal moves from s to goal."""
+    table = bytearray([255]) * TABLE_SIZE
+    table[table_index(goal)] = 0
+    frontier = [list(goal)]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for state in frontier:
+            blank = state.index(0)
+            for nb, _ in MOVES[blank]:
+                state[blank], state[nb] = state[nb], 0
+                r = table_index(state)
+                if table[r] == 255:
+                    table[r] = depth
+                    next_frontier.append(state[:])
+                state[nb], state[blank] = state[blank], 0
+        frontier = next_frontier
+    return table
+
+def save_perfect_table(path, goal, table):
+    with open(path, "wb") as f:
+        f.write(TABLE_MAGIC + bytes(goal))
+        f.write(table)
+
+def load_perfect_table(path):
+    """Memory-map a saved table; returns (goal, table)."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[:4] != TABLE_MAGIC or len(mm) != 13 + TABLE_SIZE:
+        raise ValueError(f"{path} is not an 8-puzzle distance table.")
+    return tuple(mm[4:13]), memoryview(mm)[13:]
+
+def solve_with_table(start, goal, table_goal, table):
+    """
+    Optimal solve by greedy descent: from each board step to the neighbour
+    whose stored distance is one less. Unsolvable boards are rejected by the
+    parity check before any lookup. Returns (path, moves) like astar.
+
+    `table_goal` is the goal `table` was built for, so the pair returned by
+    load_perfect_table can be passed straight through. Raises ValueError if
+    it differs from `goal`: the slot index drops the lowest rank bit, so the
+    table alone cannot tell apart goals that differ by one tile swap.
+    """
+    if tuple(table_goal) != tuple(goal) or table[table_index(goal)] != 0:
+        raise ValueError("Distance table was built for a different goal.")
+    if not is_solvable(start, goal):
+        return None, None
+    state = list(start)
+    path = [tuple(state)]
+    moves = []
+    dist = table[table_index(state)]
+    while dist:
+        blank = state.index(0)
+        for nb, action in MOVES[blank]:
+            state[blank], state[nb] = state[nb], 0
+            if table[table_index(state)] == dist - 1:
+                break
+            state[nb], state[blank] = state[blank], 0
+        else:
+            raise ValueError("Distance table is inconsistent: no neighbour is one move closer.")
+        dist -= 1
+        path.append(tuple(state))
+        moves.append(action)
+    return path, moves
+
+# -------- Bidirectional search --------
+
+def join_paths(meet, parent_fwd, parent_bwd):
+    """Splice start..meet and meet..goal from two parent-pointer dicts into (path, moves)."""
+    path = []
+    state = meet
+    while state is not None:
+        path.append(state)
+        state = parent_fwd[state]
+    path.reverse()
+    state = parent_bwd[meet]
+    while state is not None:
+        path.append(state)
+        state = parent_bwd[state]
+    moves = [DELTA_ACTION[b.index(0) - a.index(0)] for a, b in zip(path, path[1:])]
+    return path, moves
+
+def bidirectional_bfs(start, goal, stats=None):
+    """
+    Breadth-first search from both ends, always expanding one whole layer of
+    the smaller frontier. When a layer touches the other side, the best
+    meeting state from that layer gives a shortest path. Returns (path, moves)
+    like astar; stats gets forward_expanded / backward_expanded.
+    """
+    expanded = [0, 0]
+
+    def finish(result):
+        if stats is not None:
+            stats["forward_expanded"], stats["backward_expanded"] = expanded
+        return result
+
+    if not is_solvable(start, goal):
+        return finish((None, None))
+    if start == goal:
+        return finish(([start], []))
+
+    parents = ({start: None}, {goal: None})
+    depths = ({start: 0}, {goal: 0})
+    frontiers = ([start], [goal])
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, depth = parents[side], depths[side]
+        other = depths[1 - side]
+        best, meet = None, None
+        next_frontier = []
+        for state in frontiers[side]:
+            expanded[side] += 1
+            d = depth[state] + 1
+            for neighbor, _ in get_neighbors(state):
+                if neighbor in depth:
+                    continue
+                parent[neighbor] = state
+                depth[neighbor] = d
+                next_frontier.append(neighbor)
+                if neighbor in other and (best is None or d + other[neighbor] < best):
+                    best, meet = d + other[neighbor], neighbor
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+        if meet is not None:
+            return finish(join_paths(meet, parents[0], parents[1]))
+
+    return finish((None, None))
+
+def bidirectional_mm(start, goal, stats=None):
+    """
+    MM bidirectional heuristic search (Holte et al.): each direction orders
+    its open list by max(g + h, 2g), with Manhattan distance to the opposite
+    end as h, and always expands the direction with the smaller priority.
+    Stops once the best meeting cost U is no larger than that priority.
+    Returns (path, moves) like astar; stats gets forward_expanded /
+    backward_expanded.
+    """
+    expanded = [0, 0]
+
+    def finish(result):
+        if stats is not None:
+            stats["forward_expanded"], stats["backward_expanded"] = expanded
+        return result
+
+    if not is_solvable(start, goal):
+        return finish((None, None))
+
+    tables = (distance_table(goal), distance_table(start))
+
+    def h(side, state):
+        table = tables[side]
+        return sum(table[t][i] for i, t in enumerate(state) if t)
+
+    parents = ({start: None}, {goal: None})
+    g_scores = ({start: 0}, {goal: 0})
+    heaps = ([], [])
+    for side, state in ((0, start), (1, goal)):
+        heapq.heappush(heaps[side], (h(side, state), 0, state))
 
-        if state in visited:
-            continue
-        visited.add(state)
+    best, meet = (0, start) if start == goal else (math.inf, None)
 
-        if state == goal:
-            return path + [state], moves
+    while heaps[0] and heaps[1]:
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        if best <= heaps[side][0][0]:
+            break
+        _, g, state = heapq.heappop(heaps[side])
+        if g > g_scores[side][state]:
+            continue  # stale entry
+        expanded[side] += 1
+        g_here, g_other = g_scores[side], g_scores[1 - side]
+        for neighbor, _ in get_neighbors(state):
+            ng = g + 1
+            if ng >= g_here.get(neighbor, math.inf):
+                continue
+            g_here[neighbor] = ng
+            parents[side][neighbor] = state
+            heapq.heappush(heaps[side], (max(ng + h(side, neighbor), 2 * ng), ng, neighbor))
+            if neighbor in g_other and ng + g_other[neighbor] < best:
+                best, meet = ng + g_other[neighbor], neighbor
 
-        for neighbor, action in get_neighbors(state):
-            if neighbor not in visited:
-                new_g = g + 1
-                new_f = new_g + manhattan(neighbor, goal)
-                heapq.heappush(pq, (new_f, new_g, neighbor, path + [state], moves + [action]))
-    return None, None
+    if meet is None:
+        return finish((None, None))
+    return finish(join_paths(meet, parents[0], parents[1]))
 
 # -------- Main Program with User Input --------
 def read_puzzle(prompt):
@@ -0,0 +1,25 @@
+"""
+Benchmarks for the solvers in this repository.
+
+    python -m benchmarks                   # run everything, compare to baseline.json
+    python -m benchmarks --quick           # smaller instances
+    python -m benchmarks --only queens     # cases whose name contains "queens"
+    python -m benchmarks --save-baseline   # record this run as the new baseline
+
+Every instance comes from a seeded generator (benchmarks.generators), so node
+counts are reproducible across runs and machines; times and memory are
+compared against the baseline with a tolerance.
+"""
+
+import importlib
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def load_module(name):
+    """Import a solver module by file name (works for names like 4_queens_csp)."""
+    return importlib.import_module(name)
@@ -0,0 +1,39 @@
+import argparse
+import sys
+
+from .runner import BASELINE_PATH, TOLERANCE, load_baseline, run_cases, save_baseline
+from .suite import cases
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Benchmark the solvers against a stored baseline.")
+    parser.add_argument("--quick", action="store_true", help="use the smaller instances")
+    parser.add_argument("--only", action="append", default=[],
+                        help="run only cases whose name contains this text (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case (best is kept; at least 3 against a baseline)")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed fractional growth in time and memory")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store this run's results in the baseline file")
+    args = parser.parse_args(argv)
+
+    selected = [c for c in cases(args.quick)
+                if not args.only or any(text in c.name for text in args.only)]
+    baseline = {} if args.save_baseline else load_baseline(args.baseline)
+    results, regressions = run_cases(selected, baseline, args.tolerance, args.repeat)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Seeded instance generators. The same arguments always give the same instance."""
+
+import functools
+import math
+import random
+
+import numpy as np
+
+from . import load_module
+
+EIGHT_PUZZLE_GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _eight_puzzle_layers(goal, max_depth):
+    """States grouped by exact optimal distance from `goal` (BFS layers)."""
+    moves = load_module("astar_8puzzle").MOVES
+    layers = [[goal]]
+    seen = {goal}
+    while len(layers) <= max_depth and layers[-1]:
+        layer = []
+        for state in layers[-1]:
+            blank = state.index(0)
+            for square, _ in moves[blank]:
+                board = list(state)
+                board[blank], board[square] = board[square], 0
+                board = tuple(board)
+                if board not in seen:
+                    seen.add(board)
+                    layer.append(board)
+        layers.append(layer)
+    return layers
+
+
+def eight_puzzles(depth, count, seed=0, goal=EIGHT_PUZZLE_GOAL):
+    """`count` distinct 8-puzzle starts exactly `depth` moves from `goal`."""
+    layer = _eight_puzzle_layers(tuple(goal), depth)[depth]
+    rng = random.Random(seed)
+    return rng.sample(sorted(layer), min(count, len(layer)))
+
+
+def as_rows(state, side=3):
+    """Flat tuple -> list of rows (the board format dfs_8puzzle uses)."""
+    return [list(state[r * side:(r + 1) * side]) for r in range(side)]
+
+
+def random_edges(num_nodes, avg_degree, max_weight=100, seed=0):
+    """
+    Random weighted directed graph as (sources, targets, weights) arrays,
+    with a Hamiltonian cycle through all nodes so every node is reachable.
+    """
+    rng = np.random.default_rng(seed)
+    ring = np.arange(num_nodes)
+    extra = num_nodes * max(avg_degree - 1, 0)
+    sources = np.concatenate([ring, rng.integers(0, num_nodes, extra)])
+    targets = np.concatenate([np.roll(ring, -1), rng.integers(0, num_nodes, extra)])
+    weights = rng.integers(1, max_weight + 1, len(sources))
+    return sources, targets, weights
+
+
+def dict_graph(sources, targets, weights, num_nodes):
+    """Edge arrays -> {node: [(neighbor, weight), ...]} as dijkstras.dijkstra takes."""
+    graph = {v: [] for v in range(num_nodes)}
+    for u, v, w in zip(sources.tolist(), targets.tolist(), weights.tolist()):
+        graph[u].append((v, w))
+    return graph
+
+
+def tsp_matrix(n, seed=0, size=1000):
+    """Symmetric distance matrix (rounded Euclidean) of n random points, plus names."""
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, size), rng.uniform(0, size)) for _ in range(n)]
+    matrix = [[round(math.dist(p, q)) for q in points] for p in points]
+    return matrix, [f"C{i}" for i in range(n)]
+
+
+def leaves(branching, depth, seed=0, low=-1000, high=1000):
+    """Random leaf values for a uniform game tree of the given shape."""
+    rng = random.Random(seed)
+    return [rng.randint(low, high) for _ in range(branching ** depth)]
+
+
+def jug_instances(count, max_capacity, seed=0):
+    """(A, B, C) triples with 1 <= A, B <= max_capacity and C <= A + B."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(count):
+        a, b = rng.randint(1, max_capacity), rng.randint(1, max_capacity)
+        out.append((a, b, rng.randint(0, a + b)))
+    return out
+
+
+def jug_sets(count, jugs, max_capacity, seed=0):
+    """(capacities, C) pairs for the N-jug shortest-plan search."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(count):
+        caps = [rng.randint(1, max_capacity) for _ in range(jugs)]
+        out.append((caps, rng.randint(1, max(caps))))
+    return out
+
+
+def preplaced_queens(n, count, seed=0):
+    """Up to `count` non-attacking queens {row: col} on an n x n board."""
+    rng = random.Random(seed)
+    is_safe = load_module("4_queens_csp").is_safe
+    placed = {}
+    for row in rng.sample(range(n), count):
+        for col in rng.sample(range(n), n):
+            if is_safe(placed, row, col):
+                placed[row] = col
+                break
+    return placed
@@ -0,0 +1,128 @@
+"""Timing, memory measurement and baseline comparison."""
+
+import gc
+import json
+import os
+import time
+import tracemalloc
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Differences smaller than these are timer and allocator noise, not regressions.
+# Every case runs for tens of milliseconds, so this floor stays far below the
+# tolerance and never hides a real slowdown.
+NOISE_SECONDS = 0.001
+NOISE_KIB = 64
+
+# Default allowed growth in time and memory. Best-of-3 times of the same code
+# on a shared machine vary by up to about 1.4x between runs.
+TOLERANCE = 0.5
+
+# Fewest timed runs when checking against a baseline: best-of-one times
+# swing far more than the tolerance.
+MIN_GATE_REPEAT = 3
+
+
+def measure(case, repeat=3):
+    """
+    Run `case` and return {"seconds", "nodes", "nodes_per_sec", "peak_kib"}.
+    An untimed warm-up run first pays for lazy imports and caches. The peak
+    memory comes from one run under tracemalloc, which would distort the
+    timing; seconds is the best of `repeat` untraced runs after that. Setup
+    is rebuilt before every run and never timed.
+    """
+    case.run(case.setup())
+
+    instance = case.setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(instance)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = float("inf")
+    nodes = None
+    for _ in range(repeat):
+        instance = case.setup()
+        gc.collect()
+        start = time.perf_counter()
+        nodes = case.run(instance)
+        best = min(best, time.perf_counter() - start)
+
+    return {
+        "seconds": best,
+        "nodes": nodes,
+        "nodes_per_sec": nodes / best if nodes is not None and best > 0 else None,
+        "peak_kib": peak / 1024,
+    }
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Merge `results` into the baseline file (other cases are kept)."""
+    baseline = load_baseline(path)
+    baseline.update(results)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare(name, result, baseline, tolerance=TOLERANCE):
+    """
+    Regressions of `result` against baseline[name], as a list of messages.
+    Node counts come from seeded instances, so any change is reported; time
+    and peak memory may grow by `tolerance` (a fraction) before they count,
+    and differences under NOISE_SECONDS / NOISE_KIB are ignored.
+    """
+    old = baseline.get(name)
+    if old is None:
+        return []
+    problems = []
+    if old.get("nodes") is not None and result["nodes"] != old["nodes"]:
+        problems.append(f"nodes {old['nodes']} -> {result['nodes']}")
+    if (result["seconds"] > old["seconds"] * (1 + tolerance)
+            and result["seconds"] - old["seconds"] > NOISE_SECONDS):
+        problems.append(f"time {old['seconds']:.3f}s -> {result['seconds']:.3f}s")
+    if (result["peak_kib"] > old["peak_kib"] * (1 + tolerance)
+            and result["peak_kib"] - old["peak_kib"] > NOISE_KIB):
+        problems.append(f"peak {old['peak_kib']:.0f} KiB -> {result['peak_kib']:.0f} KiB")
+    return problems
+
+
+def run_cases(cases, baseline=None, tolerance=TOLERANCE, repeat=3, out=print):
+    """
+    Measure every case, print a table row per case; returns (results, regressions).
+    With a baseline each case gets at least MIN_GATE_REPEAT timed runs.
+    """
+    baseline = baseline or {}
+    if baseline:
+        repeat = max(repeat, MIN_GATE_REPEAT)
+    results = {}
+    regressions = {}
+    out(f"{'case':<52} {'time (s)':>9} {'nodes':>10} {'nodes/s':>11} {'peak KiB':>9}  vs baseline")
+    for case in cases:
+        result = measure(case, repeat)
+        results[case.name] = result
+        problems = compare(case.name, result, baseline, tolerance)
+        if problems:
+            regressions[case.name] = problems
+        old = baseline.get(case.name)
+        if old is None:
+            verdict = "new"
+        elif problems:
+            verdict = "REGRESSION: " + "; ".join(problems)
+        else:
+            verdict = f"ok ({result['seconds'] / old['seconds']:.2f}x time)" if old["seconds"] else "ok"
+        nodes = "-" if result["nodes"] is None else result["nodes"]
+        rate = "-" if result["nodes_per_sec"] is None else f"{result['nodes_per_sec']:.0f}"
+        out(f"{case.name:<52} {result['seconds']:>9.3f} {nodes:>10} {rate:>11} "
+            f"{result['peak_kib']:>9.0f}  {verdict}")
+    return results, regressions
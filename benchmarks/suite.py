@@ -0,0 +1,235 @@
+"""
+Benchmark cases. Each case has a name (which includes its parameters, so a
+baseline entry only matches a run on the same instances), a setup function
+that builds the instances outside the timed region, and a run function that
+solves them and returns the work done in nodes (states expanded, dp cells
+or tours costed, depending on the solver).
+"""
+
+from collections import namedtuple
+
+from . import generators as gen
+from . import load_module
+
+Case = namedtuple("Case", "name setup run")
+
+BFS_ROOTS = 8
+
+
+def _astar_cases(depth, count):
+    astar = load_module("astar_8puzzle")
+    ida = load_module("ida_star_npuzzle")
+    dfs = load_module("dfs_8puzzle")
+    goal = gen.EIGHT_PUZZLE_GOAL
+
+    def puzzles():
+        return gen.eight_puzzles(depth, count, seed=depth)
+
+    def run_astar(starts):
+        nodes = 0
+        for start in starts:
+            stats = {}
+            astar.astar(start, goal, stats)
+            nodes += stats["expanded"]
+        return nodes
+
+    def run_mm(starts):
+        nodes = 0
+        for start in starts:
+            stats = {}
+            astar.bidirectional_mm(start, goal, stats)
+            nodes += stats["forward_expanded"] + stats["backward_expanded"]
+        return nodes
+
+    def run_ida(starts):
+        nodes = 0
+        for start in starts:
+            stats = {}
+            ida.ida_star(start, goal, stats=stats)
+            nodes += stats["expanded"]
+        return nodes
+
+    shallow = max(depth // 2, 1)
+
+    def run_iddfs(starts):
+        nodes = 0
+        for start in starts:
+            stats = {}
+            dfs.dfs(gen.as_rows(start), gen.as_rows(goal), max_depth=shallow, stats=stats)
+            nodes += stats["expanded"]
+        return nodes
+
+    tag = f"depth={depth},count={count}"
+    return [
+        Case(f"8puzzle_astar[{tag}]", puzzles, run_astar),
+        Case(f"8puzzle_bidirectional_mm[{tag}]", puzzles, run_mm),
+        Case(f"8puzzle_ida_star[{tag}]", puzzles, run_ida),
+        Case(f"8puzzle_iddfs[depth={shallow},count={count}]",
+             lambda: gen.eight_puzzles(shallow, count, seed=shallow), run_iddfs),
+    ]
+
+
+def _graph_cases(num_nodes, avg_degree):
+    dijkstras = load_module("dijkstras")
+    graphs = load_module("dfs_bfs_graph")
+
+    def edges():
+        return gen.random_edges(num_nodes, avg_degree, seed=num_nodes)
+
+    def dict_setup():
+        return gen.dict_graph(*edges(), num_nodes)
+
+    def run_dict(graph):
+        distances, _ = dijkstras.dijkstra(graph, 0)
+        return sum(1 for d in distances.values() if d < float("inf"))
+
+    def csr_setup():
+        return dijkstras.csr_from_edges(num_nodes, *edges())
+
+    def run_csr(queue):
+        def run(csr):
+            dist, _ = dijkstras.dijkstra_csr(csr, 0, queue=queue)
+            return int((dist < float("inf")).sum())
+        return run
+
+    def graph_setup():
+        sources, targets, _ = edges()
+        graph = graphs.Graph()
+        for v in range(num_nodes):
+            graph.vertex_id(v)
+        for u, v in zip(sources.tolist(), targets.tolist()):
+            graph.add_edge(u, v)
+        return graph
+
+    # One BFS is too quick to time well, so both BFS cases sweep from several roots.
+    roots = range(0, num_nodes, max(num_nodes // BFS_ROOTS, 1))
+
+    def run_bfs(graph):
+        return sum(1 for root in roots for _ in graph.bfs(root))
+
+    def levels_setup():
+        return graph_setup().to_csr()
+
+    def run_levels(csr):
+        return sum(int((graphs.bfs_levels(*csr, root) >= 0).sum()) for root in roots)
+
+    tag = f"nodes={num_nodes},degree={avg_degree}"
+    bfs_tag = f"{tag},roots={len(roots)}"
+    return [
+        Case(f"dijkstra_dict[{tag}]", dict_setup, run_dict),
+        Case(f"dijkstra_csr_heapq[{tag}]", csr_setup, run_csr("heapq")),
+        Case(f"dijkstra_csr_dial[{tag}]", csr_setup, run_csr("dial")),
+        Case(f"bfs_generator[{bfs_tag}]", graph_setup, run_bfs),
+        Case(f"bfs_levels_numpy[{bfs_tag}]", levels_setup, run_levels),
+    ]
+
+
+def _tsp_cases(exact_n, brute_n):
+    tsp = load_module("travellingsalesman")
+
+    def run_held_karp(instance):
+        matrix, names = instance
+        stats = {}
+        tsp.tsp_held_karp(matrix, names, 0, stats=stats)
+        return stats["cells"]
+
+    def run_brute(instance):
+        matrix, names = instance
+        stats = {}
+        tsp.tsp_brute_force(matrix, names, 0, stats=stats)
+        return stats["permutations"]
+
+    return [
+        Case(f"tsp_held_karp[n={exact_n}]", lambda: gen.tsp_matrix(exact_n, seed=exact_n), run_held_karp),
+        Case(f"tsp_brute_force[n={brute_n}]", lambda: gen.tsp_matrix(brute_n, seed=brute_n), run_brute),
+    ]
+
+
+def _game_cases(branching, depth, mnk):
+    alpha_beta = load_module("alpha_beta_pruning")
+    minmax = load_module("minmax")
+    cases = []
+    for name, engine in alpha_beta.ENGINES.items():
+        def run(values, engine=engine):
+            _, counts = engine(values, branching, depth)
+            return counts["nodes"]
+        cases.append(Case(f"alpha_beta_{name}[b={branching},d={depth}]",
+                          lambda: gen.leaves(branching, depth, seed=depth), run))
+
+    m, n, k, max_depth = mnk
+
+    def run_mnk(engine):
+        engine.best_move(time_limit=float("inf"), max_depth=max_depth)
+        return engine.nodes
+
+    cases.append(Case(f"mnk_engine[m={m},n={n},k={k},depth={max_depth}]",
+                      lambda: minmax.MNKEngine(m, n, k, tt_bits=16), run_mnk))
+    return cases
+
+
+def _jug_cases(count, max_capacity):
+    water_jug = load_module("water_jug")
+
+    def run_bfs(instances):
+        nodes = 0
+        for a, b, c in instances:
+            stats = {}
+            water_jug.can_measure_water_bfs(a, b, c, stats=stats)
+            nodes += stats["expanded"]
+        return nodes
+
+    def run_plans(instances):
+        nodes = 0
+        for caps, c in instances:
+            stats = {}
+            water_jug.shortest_plan(caps, c, stats=stats)
+            nodes += stats["expanded"]
+        return nodes
+
+    return [
+        Case(f"water_jug_bfs[count={count},max={max_capacity}]",
+             lambda: gen.jug_instances(count, max_capacity, seed=count), run_bfs),
+        Case(f"water_jug_3jug_plan[count={count},max={max_capacity // 4}]",
+             lambda: gen.jug_sets(count, 3, max_capacity // 4, seed=count), run_plans),
+    ]
+
+
+def _queens_cases(count_n, csp_n, local_n):
+    queens = load_module("4_queens_csp")
+
+    def run_count(n):
+        stats = {}
+        queens.count_solutions(n, processes=1, stats=stats)
+        return stats["nodes"]
+
+    def run_csp(instance):
+        n, placed = instance
+        stats = {}
+        queens.solve_queens_csp(n, placed, stats=stats)
+        return stats["nodes"]
+
+    def run_local(n):
+        stats = {}
+        queens.min_conflicts(n, seed=0, stats=stats)
+        return stats["steps"]
+
+    return [
+        Case(f"queens_count_bitmask[n={count_n}]", lambda: count_n, run_count),
+        Case(f"queens_csp_engine[n={csp_n},preplaced=3]",
+             lambda: (csp_n, gen.preplaced_queens(csp_n, 3, seed=csp_n)), run_csp),
+        Case(f"queens_min_conflicts[n={local_n}]", lambda: local_n, run_local),
+    ]
+
+
+def cases(quick=False):
+    """
+    Every benchmark case; quick=True uses smaller instances. Even the quick
+    ones are sized to run for tens of milliseconds, well above timer noise.
+    """
+    if quick:
+        return (_astar_cases(20, 40) + _graph_cases(20000, 4) + _tsp_cases(16, 9)
+                + _game_cases(3, 11, (3, 3, 3, 9)) + _jug_cases(200, 80)
+                + _queens_cases(11, 20, 20000))
+    return (_astar_cases(22, 60) + _graph_cases(50000, 5) + _tsp_cases(17, 10)
+            + _game_cases(4, 10, (4, 4, 3, 6)) + _jug_cases(100, 200)
+            + _queens_cases(12, 40, 100000))
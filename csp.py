@@ -0,0 +1,227 @@
+"""
+Generic finite-domain constraint satisfaction solver.
+
+Each variable's domain is an int bitset over its list of values (bit i set
+means values[i] is still possible). Constraints are either binary
+predicates, compiled once into per-value support bitsets, or global
+predicates over any scope. The search does the following:
+
+- AC-3 arc consistency before the search starts;
+- forward checking, with every domain change recorded on a trail and
+  undone on backtrack;
+- MRV variable ordering (smallest domain first), ties broken by degree;
+- least-constraining-value ordering;
+- conflict-directed backjumping (FC-CBJ): a dead end returns the set of
+  variables responsible, and the search unwinds straight past every
+  assignment not in that set.
+
+Every feature can be switched off for comparison.
+"""
+from collections import deque
+
+
+def _bits(mask):
+    """Indices of the set bits of `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CSP:
+    def __init__(self):
+        self.names = []        # var -> name
+        self.values = []       # var -> list of values
+        self.domains = []      # var -> bitset of value indices
+        self.support = []      # var -> {neighbour: [bitset of neighbour values per value]}
+        self.globals = []      # (scope vars, predicate)
+        self.var_globals = []  # var -> indices into self.globals
+        self.ids = {}
+        self.stats = {"nodes": 0, "backjumps": 0}
+
+    def add_variable(self, name, values):
+        """Add a variable with the given candidate values; returns its index."""
+        values = list(values)
+        var = self.ids[name] = len(self.names)
+        self.names.append(name)
+        self.values.append(values)
+        self.domains.append((1 << len(values)) - 1)
+        self.support.append({})
+        self.var_globals.append([])
+        return var
+
+    def add_constraint(self, x, y, predicate):
+        """Binary constraint: predicate(value of x, value of y) must hold."""
+        x, y = self.ids[x], self.ids[y]
+        xs, ys = self.values[x], self.values[y]
+        forward = [sum(1 << j for j, b in enumerate(ys) if predicate(a, b)) for a in xs]
+        backward = [sum(1 << i for i, a in enumerate(xs) if forward[i] >> j & 1)
+                    for j in range(len(ys))]
+        # Several constraints on one pair are merged into one support table.
+        for u, v, table in ((x, y, forward), (y, x, backward)):
+            old = self.support[u].get(v)
+            self.support[u][v] = table if old is None else [p & q for p, q in zip(old, table)]
+
+    def add_global(self, scope, predicate):
+        """Global constraint: predicate(*values of scope) must hold."""
+        scope = tuple(self.ids[name] for name in scope)
+        for var in scope:
+            self.var_globals[var].append(len(self.globals))
+        self.globals.append((scope, predicate))
+
+    def add_all_different(self, scope):
+        """All variables in `scope` take different values."""
+        scope = list(scope)
+        for i, x in enumerate(scope):
+            for y in scope[i + 1:]:
+                self.add_constraint(x, y, lambda a, b: a != b)
+
+    # ----------- Arc consistency -----------
+
+    def ac3(self, domains):
+        """Prune `domains` in place to arc consistency; False on a wipe-out."""
+        support = self.support
+        queue = deque((x, y) for x in range(len(domains)) for y in support[x])
+        queued = set(queue)
+        while queue:
+            x, y = queue.popleft()
+            queued.discard((x, y))
+            table, dy = support[x][y], domains[y]
+            kept = domains[x]
+            for a in _bits(kept):
+                if not table[a] & dy:
+                    kept &= ~(1 << a)
+            if kept != domains[x]:
+                if not kept:
+                    return False
+                domains[x] = kept
+                for z in support[x]:
+                    if z != y and (z, x) not in queued:
+                        queued.add((z, x))
+                        queue.append((z, x))
+        return True
+
+    # ----------- Search -----------
+
+    def solve(self, ac3=True, forward_check=True, mrv=True, lcv=True, backjump=True):
+        """
+        First solution as {name: value}, or None. self.stats holds the
+        number of assignments tried ("nodes") and of backjumps that skipped
+        at least one level.
+        """
+        self.stats = {"nodes": 0, "backjumps": 0}
+        domains = list(self.domains)
+        if ac3 and not self.ac3(domains):
+            return None
+        self._domains = domains
+        self._assigned = [-1] * len(domains)   # var -> value index or -1
+        self._trail = []                       # (var, old domain)
+        self._culprits = [[] for _ in domains]  # var -> pruners, one tuple per prune
+        self._options = (forward_check, mrv, lcv, backjump)
+        result = self._search(len(domains))
+        if isinstance(result, set):
+            return None
+        return {self.names[v]: self.values[v][i] for v, i in enumerate(self._assigned)}
+
+    def _select(self):
+        assigned, domains = self._assigned, self._domains
+        free = [v for v in range(len(domains)) if assigned[v] < 0]
+        if not self._options[1]:
+            return free[0]
+        return min(free, key=lambda v: (domains[v].bit_count(),
+                                        -sum(1 for y in self.support[v] if assigned[y] < 0)))
+
+    def _order(self, var):
+        values = list(_bits(self._domains[var]))
+        if self._options[2] and len(values) > 1:
+            domains, assigned = self._domains, self._assigned
+            neighbours = [(table, y) for y, table in self.support[var].items() if assigned[y] < 0]
+            values.sort(key=lambda a: -sum((table[a] & domains[y]).bit_count()
+                                           for table, y in neighbours))
+        return values
+
+    def _prune(self, y, kept, pruners):
+        self._trail.append((y, self._domains[y]))
+        self._domains[y] = kept
+        self._culprits[y].append(pruners)
+
+    def _undo(self, mark):
+        trail, domains, culprits = self._trail, self._domains, self._culprits
+        while len(trail) > mark:
+            y, old = trail.pop()
+            domains[y] = old
+            culprits[y].pop()
+
+    def _explain(self, var):
+        """Assigned variables whose pruning emptied or narrowed `var`."""
+        return set().union(*self._culprits[var])
+
+    def _propagate(self, var, a):
+        """
+        Apply var = value index a. Returns None if consistent, otherwise the
+        set of assigned variables that together caused the failure.
+        """
+        assigned, domains = self._assigned, self._domains
+        if self._options[0]:
+            for y, table in self.support[var].items():
+                if assigned[y] < 0:
+                    kept = domains[y] & table[a]
+                    if kept != domains[y]:
+                        self._prune(y, kept, (var,))
+                        if not kept:
+                            return self._explain(y)
+        else:
+            for y, table in self.support[var].items():
+                if assigned[y] >= 0 and not table[a] >> assigned[y] & 1:
+                    return {var, y}
+
+        for g in self.var_globals[var]:
+            scope, predicate = self.globals[g]
+            free = [v for v in scope if assigned[v] < 0]
+            if not free:
+                if not predicate(*(self.values[v][assigned[v]] for v in scope)):
+                    return set(scope)
+            elif len(free) == 1 and self._options[0]:
+                y = free[0]
+                args = [self.values[v][assigned[v]] if v != y else None for v in scope]
+                slot = scope.index(y)
+                kept = domains[y]
+                for b in _bits(kept):
+                    args[slot] = self.values[y][b]
+                    if not predicate(*args):
+                        kept &= ~(1 << b)
+                if kept != domains[y]:
+                    pruners = tuple(v for v in scope if v != y)
+                    self._prune(y, kept, pruners)
+                    if not kept:
+                        return self._explain(y)
+        return None
+
+    def _search(self, remaining):
+        """True on success, otherwise the conflict set of this dead end."""
+        if remaining == 0:
+            return True
+        backjump = self._options[3]
+        var = self._select()
+        conflict = set()
+        for a in self._order(var):
+            self.stats["nodes"] += 1
+            mark = len(self._trail)
+            self._assigned[var] = a
+            failure = self._propagate(var, a)
+            if failure is None:
+                failure = self._search(remaining - 1)
+                if failure is True:
+                    return True
+                if backjump and var not in failure:
+                    # Nothing in the conflict depends on var: skip its other values.
+                    self._assigned[var] = -1
+                    self._undo(mark)
+                    self.stats["backjumps"] += 1
+                    return failure
+            conflict |= failure
+            self._assigned[var] = -1
+            self._undo(mark)
+        conflict |= self._explain(var)
+        conflict.discard(var)
+        return conflict
@@ -39,28 +39,83 @@ def get_neighbors(state):
             neighbors.append((new_state, move))
     return neighbors
 
-# DFS Algorithm
-def dfs(start, goal, max_depth=50):
-    stack = [(start, [], 0)]  # (state, path, depth)
-    visited = set()
-    
-    while stack:
-        state, path, depth = stack.pop()
-        serialized = serialize(state)
-        
-        if serialized in visited:
-            continue
-        visited.add(serialized)
-        
-        if state == goal:
-            return path
-        
-        if depth >= max_depth:
-            continue
-        
-        for neighbor, move in get_neighbors(state):
-            stack.append((neighbor, path + [move], depth + 1))
-    
+# Moves available from each blank square of the flattened board: (square, name)
+def build_move_table():
+    table = []
+    for r in range(3):
+        for c in range(3):
+            options = []
+            for move, (dr, dc) in {'Up': (-1, 0), 'Down': (1, 0), 'Left': (0, -1), 'Right': (0, 1)}.items():
+                if is_valid(r + dr, c + dc):
+                    options.append(((r + dr) * 3 + c + dc, move))
+            table.append(options)
+    return table
+
+MOVE_TABLE = build_move_table()
+
+# Opposite moves never follow each other
+OPPOSITE = {'Up': 'Down', 'Down': 'Up', 'Left': 'Right', 'Right': 'Left'}
+
+# Moves cannot change the parity of tile inversions on a 3-wide board
+def is_solvable(start, goal):
+    """Same tiles on both boards, and moves never change the inversion parity."""
+    def parity(state):
+        tiles = [v for row in state for v in row if v]
+        return sum(a > b for i, a in enumerate(tiles) for b in tiles[i + 1:]) % 2
+    if sorted(v for row in start for v in row) != sorted(v for row in goal for v in row):
+        return False
+    return parity(start) == parity(goal)
+
+# Iterative-deepening DFS
+def dfs(start, goal, max_depth=50, stats=None):
+    """
+    Depth-limited DFS repeated with limits 0, 1, ..., max_depth, so the first
+    solution found is a shortest one. Moves are applied to and undone on one
+    flattened board, repeated states are pruned only along the current path,
+    the previous move is never undone, and a single shared stack holds the
+    moves. Memory stays O(depth).
+
+    If a dict is passed as `stats`, stats["expanded"] is set to the number
+    of boards visited over all iterations.
+    """
+    if stats is not None:
+        stats["expanded"] = 0
+    if not is_solvable(start, goal):
+        return None
+
+    board = [v for row in start for v in row]
+    target = [v for row in goal for v in row]
+    moves = []
+    on_path = {tuple(board)}
+
+    def search(blank, limit):
+        if stats is not None:
+            stats["expanded"] += 1
+        if board == target:
+            return True
+        if len(moves) == limit:
+            return False
+        last = moves[-1] if moves else None
+        for square, move in MOVE_TABLE[blank]:
+            if last == OPPOSITE[move]:
+                continue
+            board[blank], board[square] = board[square], 0
+            key = tuple(board)
+            if key not in on_path:
+                on_path.add(key)
+                moves.append(move)
+                if search(square, limit):
+                    return True
+                moves.pop()
+                on_path.discard(key)
+            board[square], board[blank] = board[blank], 0
+        return False
+
+    blank = board.index(0)
+    for limit in range(max_depth + 1):
+        if search(blank, limit):
+            return moves
+
     return None  # No solution found
 
 # Take user input for a 3x3 puzzle
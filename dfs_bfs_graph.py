@@ -1,66 +1,268 @@
+from array import array
 from collections import deque
 
-# Global graph dictionary
-graph = {}
+import numpy as np
+
+class Graph:
+    """
+    Graph with compact integer vertex ids.
+
+    Vertex labels (any hashable, usually strings) are mapped to ids
+    0, 1, 2, ... in order of first appearance; adjacency is one array('i')
+    of neighbour ids per vertex. Traversals are generators over labels, so a
+    consumer can stop early without the rest of the graph being visited.
+    """
+
+    def __init__(self, directed=False):
+        self.directed = directed
+        self.ids = {}       # label -> id
+        self.names = []     # id -> label
+        self.adj = []       # id -> array of neighbour ids
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, label):
+        return label in self.ids
+
+    def vertex_id(self, label):
+        """Id of `label`, adding the vertex if it is new."""
+        vid = self.ids.get(label)
+        if vid is None:
+            vid = self.ids[label] = len(self.names)
+            self.names.append(label)
+            self.adj.append(array("i"))
+        return vid
+
+    def add_edge(self, u, v):
+        a, b = self.vertex_id(u), self.vertex_id(v)
+        self.adj[a].append(b)
+        if not self.directed:
+            self.adj[b].append(a)
+
+    def load_edges(self, path, chunk_lines=1 << 20):
+        """
+        Stream a whitespace-separated edge-list file ("u v" per line, extra
+        columns and '#' comments ignored) into the graph, reading about
+        `chunk_lines` lines at a time so memory stays bounded by the graph.
+        """
+        vertex_id, adj, directed = self.vertex_id, self.adj, self.directed
+        with open(path) as f:
+            while True:
+                lines = f.readlines(chunk_lines * 16)
+                if not lines:
+                    break
+                for line in lines:
+                    parts = line.split()
+                    if len(parts) < 2 or parts[0].startswith("#"):
+                        continue
+                    a, b = vertex_id(parts[0]), vertex_id(parts[1])
+                    adj[a].append(b)
+                    if not directed:
+                        adj[b].append(a)
+        return self
+
+    def to_csr(self):
+        """(indptr, indices) NumPy arrays of the adjacency lists."""
+        indptr = np.zeros(len(self.adj) + 1, dtype=np.int64)
+        np.cumsum([len(a) for a in self.adj], out=indptr[1:])
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        for vid, neighbors in enumerate(self.adj):
+            indices[indptr[vid]:indptr[vid + 1]] = np.frombuffer(neighbors, dtype=np.int32)
+        return indptr, indices
+
+    def reverse_csr(self):
+        """CSR of the reversed edges (needed by bottom-up BFS on directed graphs)."""
+        indptr, indices = self.to_csr()
+        sources = np.repeat(np.arange(len(self.adj), dtype=np.int32), np.diff(indptr))
+        order = np.argsort(indices, kind="stable")
+        rev_indptr = np.zeros(len(self.adj) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=len(self.adj)), out=rev_indptr[1:])
+        return rev_indptr, sources[order]
+
+    def bfs_levels(self, start):
+        """Hop distance from `start` per vertex id (-1 if unreachable)."""
+        indptr, indices = self.to_csr()
+        in_indptr, in_indices = self.reverse_csr() if self.directed else (None, None)
+        return bfs_levels(indptr, indices, self.ids[start], in_indptr, in_indices)
+
+    def connected_components(self):
+        """Component label per vertex id (undirected graphs)."""
+        return connected_components(*self.to_csr())
+
+    # BFS traversal
+    def bfs(self, start):
+        """Yield vertices in breadth-first order; each is queued at most once."""
+        adj, names = self.adj, self.names
+        s = self.ids[start]
+        visited = bytearray(len(names))
+        visited[s] = 1
+        queue = deque([s])
+        while queue:
+            vertex = queue.popleft()
+            yield names[vertex]
+            for neighbor in adj[vertex]:
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+
+    # DFS (iterative, same order as a stack seeded with reversed neighbours)
+    def dfs_iterative(self, start):
+        adj, names = self.adj, self.names
+        visited = bytearray(len(names))
+        stack = [self.ids[start]]
+        while stack:
+            vertex = stack.pop()
+            if not visited[vertex]:
+                visited[vertex] = 1
+                yield names[vertex]
+                stack.extend(n for n in reversed(adj[vertex]) if not visited[n])
+
+    # DFS with an explicit stack: the order of the recursive version, any depth
+    def dfs(self, start, order="pre"):
+        """
+        Yield vertices in depth-first pre-order (as the recursive DFS
+        visited them) or post-order (each vertex after all its
+        descendants). The stack holds (vertex, next neighbour index), so
+        paths of any length work without touching the recursion limit.
+        """
+        if order not in ("pre", "post"):
+            raise ValueError("order must be 'pre' or 'post'")
+        adj, names = self.adj, self.names
+        s = self.ids[start]
+        visited = bytearray(len(names))
+        visited[s] = 1
+        if order == "pre":
+            yield names[s]
+        stack = [[s, 0]]
+        while stack:
+            top = stack[-1]
+            vertex, i = top
+            neighbors = adj[vertex]
+            while i < len(neighbors) and visited[neighbors[i]]:
+                i += 1
+            if i == len(neighbors):
+                stack.pop()
+                if order == "post":
+                    yield names[vertex]
+                continue
+            top[1] = i + 1
+            child = neighbors[i]
+            visited[child] = 1
+            if order == "pre":
+                yield names[child]
+            stack.append([child, 0])
+
+# ----------- Direction-optimizing BFS over CSR arrays -----------
+
+def _gather(indptr, indices, vertices):
+    """Neighbour ids of all `vertices`, concatenated, plus each vertex's degree."""
+    starts = indptr[vertices]
+    counts = indptr[vertices + 1] - starts
+    total = int(counts.sum())
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+    return indices[offsets], counts
+
+def bfs_levels(indptr, indices, sources, in_indptr=None, in_indices=None, alpha=14, beta=24):
+    """
+    Level-synchronous BFS (Beamer's direction-optimizing variant).
+
+    Returns an int32 array with each vertex's distance in edges from the
+    nearest of `sources` (-1 if unreachable). Every step is vectorized:
+    - top-down expands all frontier edges at once and keeps unseen targets;
+    - bottom-up checks every unvisited vertex's in-edges against a frontier
+      bitmap, which is cheaper once the frontier is large.
+    It switches to bottom-up when the frontier's edges exceed 1/alpha of the
+    unvisited vertices' edges, and back when the frontier holds fewer than
+    1/beta of the vertices. For directed graphs pass the reverse CSR as
+    in_indptr/in_indices (undirected graphs use the same arrays).
+    """
+    n = len(indptr) - 1
+    if in_indptr is None:
+        in_indptr, in_indices = indptr, indices
+    degree = np.diff(indptr)
+    in_degree = np.diff(in_indptr)
+    levels = np.full(n, -1, dtype=np.int32)
+    frontier = np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+    levels[frontier] = 0
+    unvisited_edges = int(in_degree.sum() - in_degree[frontier].sum())
+    bottom_up = False
+    level = 0
+
+    while len(frontier):
+        level += 1
+        frontier_edges = int(degree[frontier].sum())
+        if not bottom_up and frontier_edges > unvisited_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        if bottom_up:
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            candidates = np.flatnonzero((levels == -1) & (in_degree > 0))
+            if len(candidates) == 0:
+                break
+            parents, counts = _gather(in_indptr, in_indices, candidates)
+            starts = np.cumsum(counts) - counts
+            found = np.logical_or.reduceat(in_frontier[parents], starts)
+            new = candidates[found]
+        else:
+            targets, _ = _gather(indptr, indices, frontier)
+            new = np.unique(targets[levels[targets] == -1])
+
+        levels[new] = level
+        unvisited_edges -= int(in_degree[new].sum())
+        frontier = new
+
+    return levels
+
+def connected_components(indptr, indices):
+    """
+    Component label per vertex of an undirected CSR graph (labels are
+    0, 1, ... in order of each component's smallest vertex).
+
+    All components are found together by hooking and pointer jumping:
+    every vertex points at a smaller-or-equal vertex; each round, for every
+    edge the larger of its two roots is hooked under the smaller, then
+    pointers are short-cut until each vertex points straight at its root.
+    Each round is a few vectorized passes over the edges, and the number of
+    rounds grows with log(n), not with the number of components.
+    """
+    n = len(indptr) - 1
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    targets = np.asarray(indices, dtype=np.int64)
+    parent = np.arange(n, dtype=np.int64)
+    while True:
+        ps, pt = parent[sources], parent[targets]
+        differ = ps != pt
+        if not differ.any():
+            break
+        ps, pt = ps[differ], pt[differ]
+        np.minimum.at(parent, np.maximum(ps, pt), np.minimum(ps, pt))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+    # Roots are each component's smallest vertex, so sorted order is the label order.
+    return np.unique(parent, return_inverse=True)[1].astype(np.int64)
 
 # Single function to create the graph (includes edge addition)
 def create_graph():
-    global graph
+    graph = Graph()
     n = int(input("Enter number of edges: "))
     print("Enter each edge as two nodes (e.g., A B or 1 2):")
     for _ in range(n):
         u, v = input().split()
-
-        # Add edge u -> v
-        if u not in graph:
-            graph[u] = []
-        graph[u].append(v)
-
-        # Add edge v -> u (undirected)
-        if v not in graph:
-            graph[v] = []
-        graph[v].append(u)
-
-# BFS traversal
-def bfs(start):
-    visited = set()
-    queue = deque([start])
-    print("\nBFS traversal:", end=' ')
-    while queue:
-        vertex = queue.popleft()
-        if vertex not in visited:
-            print(vertex, end=' ')
-            visited.add(vertex)
-            queue.extend(neighbor for neighbor in graph[vertex] if neighbor not in visited)
-
-# DFS (recursive)
-def dfs_recursive(vertex, visited=None):
-    if visited is None:
-        visited = set()
-        print("\nDFS Recursive traversal:", end=' ')
-    print(vertex, end=' ')
-    visited.add(vertex)
-    for neighbor in graph[vertex]:
-        if neighbor not in visited:
-            dfs_recursive(neighbor, visited)
-
-# DFS (iterative)
-def dfs_iterative(start):
-    visited = set()
-    stack = [start]
-    print("\nDFS Iterative traversal:", end=' ')
-    while stack:
-        vertex = stack.pop()
-        if vertex not in visited:
-            print(vertex, end=' ')
-            visited.add(vertex)
-            stack.extend(reversed(graph[vertex]))
+        graph.add_edge(u, v)  # undirected: adds u -> v and v -> u
+    return graph
 
 # Main
 if __name__ == "__main__":
-    create_graph()
+    graph = create_graph()
     start_node = input("\nEnter start node for traversal: ")
 
-    bfs(start_node)
-    dfs_recursive(start_node)
-    dfs_iterative(start_node)
+    print("\nBFS traversal:", *graph.bfs(start_node))
+    print("DFS pre-order traversal:", *graph.dfs(start_node))
+    print("DFS Iterative traversal:", *graph.dfs_iterative(start_node))
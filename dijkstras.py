@@ -1,20 +1,34 @@
 import heapq
+import math
+import sys
+import time
+from collections import OrderedDict, namedtuple
 
-# Global distance dictionary
-distances = {}
+import numpy as np
+
+# Compressed-sparse-row graph: the out-edges of node u are
+# indices[indptr[u]:indptr[u+1]] with matching weights. names[u] is the
+# original label of node u.
+CSRGraph = namedtuple("CSRGraph", ["indptr", "indices", "weights", "names"])
 
 # Function to initialize distances
 def initialize_distances(graph, start):
-    global distances
     distances = {}
     for node in graph:
         distances[node] = float('inf')
     distances[start] = 0
+    return distances
 
 # Dijkstra's algorithm
-def dijkstra(graph, start):
-    global distances
-    initialize_distances(graph, start)
+def dijkstra(graph, start, target=None):
+    """
+    Shortest distances from `start` on a dict graph {node: [(neighbor, weight), ...]}.
+    Returns (distances, predecessors); stops early once `target` is settled.
+    After an early stop only settled nodes keep a distance and predecessor;
+    the rest read inf and are left out of `predecessors`.
+    """
+    distances = initialize_distances(graph, start)
+    predecessors = {start: None}
 
     pq = []
     heapq.heappush(pq, (0, start))
@@ -24,13 +38,738 @@ def dijkstra(graph, start):
 
         if current_dist > distances[current_node]:
             continue
+        if current_node == target:
+            # Tentative distances up to the target's are already final.
+            for node in [v for v in predecessors if distances[v] > current_dist]:
+                distances[node] = float('inf')
+                del predecessors[node]
+            break
 
         for neighbor, weight in graph[current_node]:
             distance = current_dist + weight
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
+                predecessors[neighbor] = current_node
                 heapq.heappush(pq, (distance, neighbor))
 
+    return distances, predecessors
+
+# ----------- CSR graphs -----------
+
+def csr_from_edges(num_nodes, sources, targets, weights, names=None):
+    """Build a CSRGraph from parallel edge arrays (node ids 0 .. num_nodes-1)."""
+    sources = np.asarray(sources, dtype=np.int64)
+    order = np.argsort(sources, kind="stable")
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+    indices = np.asarray(targets, dtype=np.int64)[order]
+    weights = np.asarray(weights)[order]
+    if names is None:
+        names = np.arange(num_nodes)
+    return CSRGraph(indptr, indices, weights, names)
+
+def csr_from_dict(graph):
+    """Convert a dict graph as used by dijkstra() into a CSRGraph."""
+    names = list(graph)
+    ids = {name: i for i, name in enumerate(names)}
+    sources, targets, weights = [], [], []
+    for u, edges in graph.items():
+        for v, w in edges:
+            sources.append(ids[u])
+            targets.append(ids[v])
+            weights.append(w)
+    return csr_from_edges(len(names), sources, targets, weights, np.array(names, dtype=object))
+
+def load_edge_list(path, directed=True, weight_dtype=np.int64, comments="#"):
+    """
+    Bulk-load a whitespace-separated "u v weight" file into a CSRGraph.
+
+    Parsing and label interning are done with NumPy (loadtxt + unique), so
+    no Python object is kept per edge. Integer labels keep their numeric
+    order; any other labels are mapped in sorted order. Undirected files
+    get both directions of every edge.
+    """
+    try:
+        edges = np.loadtxt(path, dtype=[("u", np.int64), ("v", np.int64), ("w", weight_dtype)],
+                           comments=comments, ndmin=1, usecols=(0, 1, 2))
+    except ValueError:
+        edges = np.loadtxt(path, dtype=[("u", "U64"), ("v", "U64"), ("w", weight_dtype)],
+                           comments=comments, ndmin=1, usecols=(0, 1, 2))
+    names, ids = np.unique(np.concatenate((edges["u"], edges["v"])), return_inverse=True)
+    ids = ids.reshape(2, -1)
+    weights = edges["w"]
+    del edges
+
+    sources, targets = ids[0], ids[1]
+    if not directed:
+        sources, targets = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+        weights = np.concatenate((weights, weights))
+    return csr_from_edges(len(names), sources, targets, weights, names)
+
+# ----------- Priority queues for Dijkstra -----------
+# Every queue holds node ids 0 .. num_nodes-1 and supports
+#   push(node, key)  insert, or lower the key of a node already queued
+#   pop()            remove and return (key, node) with the smallest key
+#   len(queue)
+# Each node is queued at most once, unlike the duplicate entries of heapq.
+
+class IndexedHeap:
+    """Array-backed binary heap with a position index for true decrease-key."""
+
+    def __init__(self, num_nodes, max_weight=None):
+        self.heap = []                 # node ids in heap order
+        self.pos = [-1] * num_nodes    # index of each node in heap, -1 if absent
+        self.key = [0] * num_nodes
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, node, key):
+        if self.pos[node] == -1:
+            self.pos[node] = len(self.heap)
+            self.heap.append(node)
+        elif key >= self.key[node]:
+            return
+        self.key[node] = key
+        self._sift_up(self.pos[node])
+
+    def pop(self):
+        heap, pos = self.heap, self.pos
+        top = heap[0]
+        last = heap.pop()
+        pos[top] = -1
+        if heap:
+            heap[0] = last
+            pos[last] = 0
+            self._sift_down(0)
+        return self.key[top], top
+
+    def _sift_up(self, i):
+        heap, pos, key = self.heap, self.pos, self.key
+        node = heap[i]
+        k = key[node]
+        while i:
+            parent = (i - 1) >> 1
+            p = heap[parent]
+            if key[p] <= k:
+                break
+            heap[i] = p
+            pos[p] = i
+            i = parent
+        heap[i] = node
+        pos[node] = i
+
+    def _sift_down(self, i):
+        heap, pos, key = self.heap, self.pos, self.key
+        n = len(heap)
+        node = heap[i]
+        k = key[node]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and key[heap[child + 1]] < key[heap[child]]:
+                child += 1
+            c = heap[child]
+            if key[c] >= k:
+                break
+            heap[i] = c
+            pos[c] = i
+            i = child
+        heap[i] = node
+        pos[node] = i
+
+class DialQueue:
+    """
+    Dial's bucket queue for integer weights 0 .. max_weight: max_weight + 1
+    circular buckets, since every queued key lies within max_weight of the
+    last key popped. push and decrease-key are O(1); pop scans at most
+    max_weight + 1 buckets.
+    """
+
+    def __init__(self, num_nodes, max_weight):
+        self.size = max_weight + 1
+        self.buckets = [set() for _ in range(self.size)]
+        self.key = [None] * num_nodes
+        self.current = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, node, key):
+        old = self.key[node]
+        if old is not None:
+            if key >= old:
+                return
+            self.buckets[old % self.size].discard(node)
+        else:
+            self.count += 1
+        self.key[node] = key
+        self.buckets[key % self.size].add(node)
+
+    def pop(self):
+        buckets, size = self.buckets, self.size
+        while not buckets[self.current % size]:
+            self.current += 1
+        node = buckets[self.current % size].pop()
+        self.count -= 1
+        key = self.key[node]
+        self.key[node] = None
+        return key, node
+
+class RadixHeap:
+    """
+    Monotone radix heap for non-negative integer keys: bucket i holds keys
+    whose highest bit differing from the last popped key is bit i - 1.
+    Popping only redistributes the first non-empty bucket, so each node
+    moves O(log C) times in total.
+    """
+
+    def __init__(self, num_nodes, max_weight=None):
+        bits = max(1, (max_weight or 1).bit_length()) + 64
+        self.buckets = [set() for _ in range(bits + 1)]
+        self.key = [None] * num_nodes
+        self.where = [0] * num_nodes
+        self.last = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def _place(self, node, key):
+        b = (key ^ self.last).bit_length()
+        self.where[node] = b
+        self.buckets[b].add(node)
+
+    def push(self, node, key):
+        old = self.key[node]
+        if old is not None:
+            if key >= old:
+                return
+            self.buckets[self.where[node]].discard(node)
+        else:
+            self.count += 1
+        self.key[node] = key
+        self._place(node, key)
+
+    def pop(self):
+        buckets, key = self.buckets, self.key
+        if not buckets[0]:
+            b = 1
+            while not buckets[b]:
+                b += 1
+            moving = buckets[b]
+            buckets[b] = set()
+            self.last = min(key[v] for v in moving)
+            for v in moving:
+                self._place(v, key[v])
+        node = buckets[0].pop()
+        self.count -= 1
+        k = key[node]
+        key[node] = None
+        return k, node
+
+QUEUES = {
+    "indexed": IndexedHeap,
+    "dial": DialQueue,
+    "radix": RadixHeap,
+}
+
+def choose_queue(weights, num_nodes=0, dial_limit=1000):
+    """
+    Pick a queue by weight range. Dial wins for non-negative integers up to
+    max(dial_limit, num_nodes) (its buckets then never outnumber the nodes).
+    Beyond that heapq's C implementation is faster than the pure-Python
+    radix and indexed heaps; those two remain the choice when the queue
+    must stay at one entry per node instead of one per relaxation.
+    """
+    weights = np.asarray(weights)
+    if weights.size and np.issubdtype(weights.dtype, np.integer) and weights.min() >= 0:
+        if weights.max() <= max(dial_limit, num_nodes):
+            return "dial"
+    return "heapq"
+
+def dijkstra_csr(csr, source, target=None, max_distance=None, queue="heapq"):
+    """
+    Reentrant Dijkstra over a CSRGraph (source/target are node ids).
+
+    Returns (dist, pred) as NumPy arrays: dist[v] is inf for nodes not
+    settled and pred[v] is -1 for the source and unreached nodes. The search
+    stops once `target` is settled or once the next node is farther than
+    `max_distance`; nodes beyond that keep dist = inf.
+
+    `queue` is "heapq" (lazy deletion of duplicate entries), a name from
+    QUEUES, or "auto" to let choose_queue pick one from the weight range.
+    """
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    n = len(indptr) - 1
+    dist = np.full(n, np.inf)
+    pred = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=bool)
+
+    if queue == "auto":
+        queue = choose_queue(weights, n)
+    if queue != "heapq":
+        max_weight = int(weights.max()) if len(weights) and queue != "indexed" else 0
+        pq = QUEUES[queue](n, max_weight)
+        tentative = [math.inf] * n
+        tentative[source] = 0
+        pq.push(source, 0)
+        while pq:
+            d, u = pq.pop()
+            if max_distance is not None and d > max_distance:
+                break
+            settled[u] = True
+            dist[u] = d
+            if u == target:
+                break
+            lo, hi = indptr[u], indptr[u + 1]
+            for v, w in zip(indices[lo:hi].tolist(), weights[lo:hi].tolist()):
+                nd = d + w
+                if nd < tentative[v] and not settled[v]:
+                    tentative[v] = nd
+                    pred[v] = u
+                    pq.push(v, nd)
+        pred[~settled] = -1  # drop tentative parents left on the frontier
+        return dist, pred
+
+    best = {source: 0}  # tentative distances of unsettled nodes
+    pq = [(0, source)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if settled[u] or d > best[u]:
+            continue
+        if max_distance is not None and d > max_distance:
+            break
+        settled[u] = True
+        dist[u] = d
+        del best[u]
+        if u == target:
+            break
+
+        lo, hi = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[lo:hi].tolist(), weights[lo:hi].tolist()):
+            nd = d + w
+            if not settled[v] and nd < best.get(v, nd + 1):
+                best[v] = nd
+                pred[v] = u
+                heapq.heappush(pq, (nd, v))
+
+    pred[~settled] = -1  # drop tentative parents left on the frontier
+    return dist, pred
+
+def benchmark_queues(num_nodes=100000, avg_degree=8, weight_ranges=(10, 1000, 10 ** 5, 10 ** 7), seed=0):
+    """
+    Time dijkstra_csr with every queue on seeded random graphs, one per
+    maximum weight, and print which queue wins for each weight range.
+    """
+    rng = np.random.default_rng(seed)
+    m = num_nodes * avg_degree
+    sources = rng.integers(0, num_nodes, m)
+    targets = rng.integers(0, num_nodes, m)
+    results = {}
+    for max_weight in weight_ranges:
+        csr = csr_from_edges(num_nodes, sources, targets, rng.integers(0, max_weight + 1, m))
+        timings = {}
+        reference = None
+        for name in ("heapq",) + tuple(QUEUES):
+            start = time.perf_counter()
+            dist, _ = dijkstra_csr(csr, 0, queue=name)
+            timings[name] = time.perf_counter() - start
+            if reference is None:
+                reference = dist
+            elif not np.array_equal(dist, reference):
+                raise AssertionError(f"{name} queue disagrees with heapq")
+        results[max_weight] = timings
+        fastest = min(timings, key=timings.get)
+        cells = "  ".join(f"{name}={t:.3f}s" for name, t in timings.items())
+        print(f"max weight {max_weight:>8}: {cells}  -> {fastest} (auto picks {choose_queue(csr.weights, num_nodes)})")
+    return results
+
+# ----------- Contraction hierarchies -----------
+
+def _witness_distances(out_adj, source, skip, limit, max_settled):
+    """Bounded Dijkstra from `source` that never passes through `skip`."""
+    dist = {source: 0}
+    pq = [(0, source)]
+    settled = 0
+    while pq:
+        d, u = heapq.heappop(pq)
+        if d > dist[u]:
+            continue
+        if d > limit or settled >= max_settled:
+            break
+        settled += 1
+        for v, (w, _) in out_adj[u].items():
+            nd = d + w
+            if v != skip and nd < dist.get(v, math.inf):
+                dist[v] = nd
+                heapq.heappush(pq, (nd, v))
+    return dist
+
+def _needed_shortcuts(in_adj, out_adj, v, max_settled):
+    """Shortcuts (u, x, weight) required to keep distances when v is removed."""
+    outs = list(out_adj[v].items())
+    if not outs:
+        return []
+    longest_out = max(w for _, (w, _) in outs)
+    shortcuts = []
+    for u, (w_in, _) in in_adj[v].items():
+        dist = _witness_distances(out_adj, u, v, w_in + longest_out, max_settled)
+        for x, (w_out, _) in outs:
+            if x != u and dist.get(x, math.inf) > w_in + w_out:
+                shortcuts.append((u, x, w_in + w_out))
+    return shortcuts
+
+def build_hierarchy(csr, max_settled=200):
+    """
+    Contract every node of a CSRGraph, least important first.
+
+    Importance is the edge difference (shortcuts added minus edges removed)
+    plus the number of already contracted neighbours, re-evaluated lazily
+    when a node reaches the front of the queue. A shortcut u->x through v
+    is added only if a bounded witness search finds no path at most as
+    short that avoids v (giving up after `max_settled` nodes just adds the
+    shortcut, which is always safe).
+
+    Returns a dict of NumPy arrays: rank, and the upward graphs "fwd" (edges
+    a->b with rank[b] > rank[a], stored under a) and "bwd" (edges a->b with
+    rank[a] > rank[b], stored under b), each as indptr/indices/weights/mid
+    where mid is the contracted node of a shortcut or -1.
+    """
+    n = len(csr.indptr) - 1
+    out_adj = [{} for _ in range(n)]   # out_adj[u][v] = (weight, mid)
+    in_adj = [{} for _ in range(n)]
+    for u in range(n):
+        lo, hi = csr.indptr[u], csr.indptr[u + 1]
+        for v, w in zip(csr.indices[lo:hi].tolist(), csr.weights[lo:hi].tolist()):
+            if v != u and w < out_adj[u].get(v, (math.inf,))[0]:
+                out_adj[u][v] = (w, -1)
+                in_adj[v][u] = (w, -1)
+
+    contracted_neighbors = [0] * n
+
+    def priority(v):
+        removed = len(in_adj[v]) + len(out_adj[v])
+        return len(_needed_shortcuts(in_adj, out_adj, v, max_settled)) - removed + contracted_neighbors[v]
+
+    pq = [(priority(v), v) for v in range(n)]
+    heapq.heapify(pq)
+    rank = np.empty(n, dtype=np.int64)
+    fwd_rows = [None] * n
+    bwd_rows = [None] * n
+    order = 0
+    while pq:
+        _, v = heapq.heappop(pq)
+        p = priority(v)
+        if pq and p > pq[0][0]:
+            heapq.heappush(pq, (p, v))  # lazy update: no longer the least important
+            continue
+
+        shortcuts = _needed_shortcuts(in_adj, out_adj, v, max_settled)
+        rank[v] = order
+        order += 1
+        fwd_rows[v] = [(x, w, mid) for x, (w, mid) in out_adj[v].items()]
+        bwd_rows[v] = [(u, w, mid) for u, (w, mid) in in_adj[v].items()]
+        for x in out_adj[v]:
+            del in_adj[x][v]
+            contracted_neighbors[x] += 1
+        for u in in_adj[v]:
+            del out_adj[u][v]
+            contracted_neighbors[u] += 1
+        out_adj[v], in_adj[v] = {}, {}
+        for u, x, w in shortcuts:
+            if w < out_adj[u].get(x, (math.inf,))[0]:
+                out_adj[u][x] = (w, v)
+                in_adj[x][u] = (w, v)
+
+    hierarchy = {"rank": rank, "names": np.asarray(csr.names)}
+    for name, rows in (("fwd", fwd_rows), ("bwd", bwd_rows)):
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(r) for r in rows], out=indptr[1:])
+        flat = [e for r in rows for e in r]
+        hierarchy[name + "_indptr"] = indptr
+        hierarchy[name + "_indices"] = np.array([e[0] for e in flat], dtype=np.int64)
+        hierarchy[name + "_weights"] = np.array([e[1] for e in flat], dtype=csr.weights.dtype)
+        hierarchy[name + "_mid"] = np.array([e[2] for e in flat], dtype=np.int64)
+    return hierarchy
+
+def save_hierarchy(path, hierarchy):
+    np.savez(path, **{k: v for k, v in hierarchy.items() if not k.startswith("_")})
+
+def load_hierarchy(path):
+    with np.load(path, allow_pickle=True) as data:
+        return {key: data[key] for key in data.files}
+
+def _upward_lists(hierarchy):
+    """Per-node Python lists of (neighbor, weight, mid) for "fwd" and "bwd",
+    built on the first query and cached in the hierarchy under "_lists"."""
+    if "_lists" not in hierarchy:
+        lists = []
+        for side in ("fwd", "bwd"):
+            indptr = hierarchy[side + "_indptr"].tolist()
+            edges = list(zip(hierarchy[side + "_indices"].tolist(),
+                             hierarchy[side + "_weights"].tolist(),
+                             hierarchy[side + "_mid"].tolist()))
+            lists.append([edges[indptr[u]:indptr[u + 1]] for u in range(len(indptr) - 1)])
+        hierarchy["_lists"] = (lists[0], lists[1], hierarchy["rank"].tolist())
+    return hierarchy["_lists"]
+
+def _edge_mid(lists, a, b):
+    """Middle node of the overlay edge a->b (-1 for an original edge)."""
+    fwd, bwd, rank = lists
+    if rank[b] > rank[a]:
+        row, other = fwd[a], b
+    else:
+        row, other = bwd[b], a
+    for v, _, mid in row:
+        if v == other:
+            return mid
+    raise KeyError((a, b))
+
+def ch_query(hierarchy, source, target):
+    """
+    Point-to-point shortest path on a hierarchy from build_hierarchy.
+
+    Runs Dijkstra upward from the source on "fwd" edges and upward from the
+    target on "bwd" edges, stopping once neither queue can beat the best
+    meeting point, then unpacks shortcuts into original edges.
+    Returns (distance, path of node ids), or (inf, []) if unreachable.
+    """
+    lists = _upward_lists(hierarchy)
+    dist = ({source: 0}, {target: 0})
+    pred = ({source: None}, {target: None})
+    queues = ([(0, source)], [(0, target)])
+    best, meet = (0, source) if source == target else (math.inf, None)
+
+    while queues[0] or queues[1]:
+        side = 0 if not queues[1] or (queues[0] and queues[0][0][0] <= queues[1][0][0]) else 1
+        d, u = heapq.heappop(queues[side])
+        if d >= best:
+            queues[side].clear()  # nothing left on this side can improve
+            continue
+        if d > dist[side][u]:
+            continue
+        other = dist[1 - side]
+        if u in other and d + other[u] < best:
+            best, meet = d + other[u], u
+        for v, w, _ in lists[side][u]:
+            nd = d + w
+            if nd < dist[side].get(v, math.inf):
+                dist[side][v] = nd
+                pred[side][v] = u
+                heapq.heappush(queues[side], (nd, v))
+
+    if meet is None:
+        return math.inf, []
+
+    overlay = []
+    node = meet
+    while node is not None:
+        overlay.append(node)
+        node = pred[0][node]
+    overlay.reverse()
+    node = pred[1][meet]
+    while node is not None:
+        overlay.append(node)
+        node = pred[1][node]
+
+    # Replace every shortcut a->b through m by a->m, m->b until none are left.
+    path = [overlay[0]]
+    stack = [(a, b) for a, b in reversed(list(zip(overlay, overlay[1:])))]
+    while stack:
+        a, b = stack.pop()
+        mid = _edge_mid(lists, a, b)
+        if mid == -1:
+            path.append(b)
+        else:
+            stack.append((mid, b))
+            stack.append((a, mid))
+    return best, path
+
+def shortest_path(pred, target, source=None):
+    """
+    Node ids from the source to `target` using a predecessor array or dict,
+    or [] if `target` was not reached. An array marks both the source and
+    unreached nodes with -1, so pass `source` to get [source] back for it.
+    """
+    if isinstance(pred, dict):
+        if target not in pred:
+            return []
+    elif pred[target] == -1 and target != source:
+        return []
+    path = []
+    node = target
+    while node is not None and node != -1:
+        path.append(node)
+        node = pred[node]
+        if isinstance(node, np.integer):
+            node = int(node)
+    return path[::-1]
+
+# ----------- Shortest-path tree cache -----------
+
+class ShortestPathCache:
+    """
+    LRU cache of shortest-path trees keyed by source, over a dict graph as
+    used by dijkstra(). Edge updates go through update_edge(), which repairs
+    every cached tree in place (Ramalingam-Reps style) instead of evicting it:
+    - a decrease on u->v relaxes outward from v, touching only nodes whose
+      distance improves;
+    - an increase (or removal) on a tree edge u->v re-settles only the
+      subtree below v, seeded from its edges into the rest of the tree;
+      increases on non-tree edges change nothing.
+    Trees are evicted least recently used first once `max_trees` or the
+    estimated `max_bytes` is exceeded. `stats` counts hits, repairs, full
+    recomputations and evictions.
+    """
+
+    def __init__(self, graph, max_trees=16, max_bytes=None):
+        self.graph = graph
+        self.max_trees = max_trees
+        self.max_bytes = max_bytes
+        self.trees = OrderedDict()   # source -> {"dist", "pred", "children"}
+        self.stats = {"hits": 0, "repairs": 0, "full_recomputations": 0, "evictions": 0}
+        # Cheapest weight of every u->v, forwards and backwards
+        self.out_edges = {u: {} for u in graph}
+        self.in_edges = {u: {} for u in graph}
+        for u, edges in graph.items():
+            for v, w in edges:
+                if w < self.out_edges[u].get(v, math.inf):
+                    self.out_edges[u][v] = w
+                    self.in_edges[v][u] = w
+
+    # ----- queries -----
+
+    def tree(self, source):
+        """Return the cached (or freshly computed) tree for `source`."""
+        tree = self.trees.get(source)
+        if tree is not None:
+            self.stats["hits"] += 1
+            self.trees.move_to_end(source)
+            return tree
+        self.stats["full_recomputations"] += 1
+        distances, predecessors = dijkstra(self.graph, source)
+        children = {node: set() for node in self.graph}
+        for node, parent in predecessors.items():
+            if parent is not None:
+                children[parent].add(node)
+        tree = {"dist": distances, "pred": predecessors, "children": children}
+        self.trees[source] = tree
+        self._evict()
+        return tree
+
+    def distances(self, source):
+        return self.tree(source)["dist"]
+
+    def path(self, source, target):
+        """(distance, [source, ..., target]) or (inf, []) if unreachable."""
+        tree = self.tree(source)
+        if tree["dist"][target] == math.inf:
+            return math.inf, []
+        return tree["dist"][target], shortest_path(tree["pred"], target, source)
+
+    def _tree_bytes(self, tree):
+        return sum(sys.getsizeof(part) for part in tree.values()) + \
+            sum(sys.getsizeof(kids) for kids in tree["children"].values())
+
+    def _evict(self):
+        while len(self.trees) > self.max_trees or (
+                self.max_bytes is not None and len(self.trees) > 1 and
+                sum(self._tree_bytes(t) for t in self.trees.values()) > self.max_bytes):
+            self.trees.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    # ----- updates -----
+
+    def update_edge(self, u, v, weight):
+        """Set the weight of u->v (math.inf removes it) and repair cached trees."""
+        old = self.out_edges[u].get(v, math.inf)
+        self.graph[u] = [(x, w) for x, w in self.graph[u] if x != v]
+        if weight == math.inf:
+            self.out_edges[u].pop(v, None)
+            self.in_edges[v].pop(u, None)
+        else:
+            self.graph[u].append((v, weight))
+            self.out_edges[u][v] = weight
+            self.in_edges[v][u] = weight
+        if weight == old:
+            return
+        for tree in self.trees.values():
+            if weight < old:
+                repaired = self._repair_decrease(tree, u, v, weight)
+            else:
+                repaired = self._repair_increase(tree, u, v)
+            if repaired:
+                self.stats["repairs"] += 1
+
+    @staticmethod
+    def _reparent(tree, node, parent):
+        old = tree["pred"].get(node)
+        if old is not None:
+            tree["children"][old].discard(node)
+        tree["pred"][node] = parent
+        if parent is not None:
+            tree["children"][parent].add(node)
+
+    def _repair_decrease(self, tree, u, v, weight):
+        dist = tree["dist"]
+        new = dist[u] + weight
+        if new >= dist[v]:
+            return False
+        dist[v] = new
+        self._reparent(tree, v, u)
+        pq = [(new, v)]
+        while pq:
+            d, x = heapq.heappop(pq)
+            if d > dist[x]:
+                continue
+            for y, w in self.out_edges[x].items():
+                if d + w < dist[y]:
+                    dist[y] = d + w
+                    self._reparent(tree, y, x)
+                    heapq.heappush(pq, (d + w, y))
+        return True
+
+    def _repair_increase(self, tree, u, v):
+        dist, pred = tree["dist"], tree["pred"]
+        if pred.get(v) != u:
+            return False  # not a tree edge: no distance depends on it
+
+        # Everything below v in the tree may get longer.
+        affected = {v}
+        stack = [v]
+        while stack:
+            for child in tree["children"][stack.pop()]:
+                affected.add(child)
+                stack.append(child)
+        for x in affected:
+            dist[x] = math.inf
+
+        # Seed each affected node from its best edge out of the unaffected part.
+        pq = []
+        for x in affected:
+            best, parent = math.inf, None
+            for y, w in self.in_edges[x].items():
+                if y not in affected and dist[y] + w < best:
+                    best, parent = dist[y] + w, y
+            self._reparent(tree, x, parent)
+            if parent is not None:
+                dist[x] = best
+                heapq.heappush(pq, (best, x))
+
+        while pq:
+            d, x = heapq.heappop(pq)
+            if d > dist[x]:
+                continue
+            for y, w in self.out_edges[x].items():
+                if y in affected and d + w < dist[y]:
+                    dist[y] = d + w
+                    self._reparent(tree, y, x)
+                    heapq.heappush(pq, (d + w, y))
+        return True
+
 # User input handling
 def main():
     graph = {}
@@ -49,7 +788,7 @@ def main():
         # graph[v].append((u, w))
 
     start_node = input("Enter starting node: ")
-    dijkstra(graph, start_node)
+    distances, _ = dijkstra(graph, start_node)
 
     print(f"\nShortest distances from {start_node}:")
     for node in graph:
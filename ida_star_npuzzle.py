@@ -0,0 +1,349 @@
+"""
+ida_star_npuzzle.py
+
+IDA* for the N-puzzle (8-, 15-, 24-puzzle) with additive pattern databases.
+- Memory used by the search is proportional to the solution depth.
+- The heuristic is a sum of disjoint pattern databases (e.g. 6-6-3 for the
+  15-puzzle). Each database stores, for every placement of its tiles, the
+  number of moves of those tiles needed to reach the goal; moves of the
+  other tiles are free, which is what makes the databases additive.
+- Databases are generated once by a retrograde (backwards) BFS from the
+  goal, saved as compact binary files (one byte per placement) and loaded
+  with mmap, so several worker processes share a single copy in memory.
+
+Boards are tuples read row by row with 0 for the blank, like astar_8puzzle.
+"""
+
+import math
+import mmap
+import multiprocessing
+import os
+import struct
+
+import numpy as np
+
+DIRECTIONS = [("Up", -1, 0), ("Down", 1, 0), ("Left", 0, -1), ("Right", 0, 1)]
+
+# Disjoint tile groups for the goal 1 2 3 ... N-1 0.
+DEFAULT_PATTERNS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 5, 6, 9, 13), (3, 4, 7, 8, 11, 12), (10, 14, 15)],
+    5: [(1, 2, 6, 7), (3, 4, 8, 9), (5, 10, 15, 20),
+        (11, 12, 16, 17), (13, 14, 18, 19), (21, 22, 23, 24)],
+}
+
+PDB_MAGIC = b"NPDB"
+
+# ----------- Board helpers -----------
+
+def default_goal(side):
+    return tuple(range(1, side * side)) + (0,)
+
+def build_move_table(side):
+    """moves[blank] -> list of (new blank position, action name)."""
+    table = []
+    for idx in range(side * side):
+        x, y = divmod(idx, side)
+        moves = []
+        for action, dx, dy in DIRECTIONS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < side and 0 <= ny < side:
+                moves.append((nx * side + ny, action))
+        table.append(moves)
+    return table
+
+def is_solvable(start, goal, side):
+    """
+    A position is reachable iff the parity of the permutation taking `goal`
+    to `start` equals the parity of the blank's Manhattan distance, since
+    every move is one transposition that moves the blank one step.
+    """
+    if sorted(start) != sorted(goal):
+        return False
+    where = {tile: i for i, tile in enumerate(goal)}
+    perm = [where[tile] for tile in start]
+    seen = [False] * len(perm)
+    swaps = 0
+    for i in range(len(perm)):
+        length = 0
+        while not seen[i]:
+            seen[i] = True
+            i = perm[i]
+            length += 1
+        if length:
+            swaps += length - 1
+    bx, by = divmod(start.index(0), side)
+    gx, gy = divmod(goal.index(0), side)
+    return swaps % 2 == (abs(bx - gx) + abs(by - gy)) % 2
+
+# ----------- Pattern databases -----------
+
+def pattern_size(cells, k):
+    """Number of placements of k distinct tiles on `cells` squares."""
+    return math.perm(cells, k)
+
+def rank_positions(positions, cells):
+    """Rank a placement (list of distinct squares) into 0 .. perm(cells, k)-1."""
+    rank = 0
+    for i, p in enumerate(positions):
+        smaller = 0
+        for q in positions[:i]:
+            if q < p:
+                smaller += 1
+        rank = rank * (cells - i) + p - smaller
+    return rank
+
+def _rank_rows(placements, cells):
+    """Vectorized rank_positions over the rows of an (m, k) array."""
+    rank = np.zeros(len(placements), dtype=np.int64)
+    for i in range(placements.shape[1]):
+        col = placements[:, i:i + 1]
+        smaller = (placements[:, :i] < col).sum(axis=1)
+        rank = rank * (cells - i) + placements[:, i] - smaller
+    return rank
+
+def build_pdb(side, tiles, goal=None, chunk_size=1 << 18):
+    """
+    Retrograde BFS from the goal placement of `tiles`.
+
+    A state is the placement of the pattern tiles only; moving a pattern tile
+    onto any adjacent square not holding another pattern tile costs 1.
+    Returns a uint8 array indexed by rank_positions().
+    """
+    goal = goal or default_goal(side)
+    cells = side * side
+    k = len(tiles)
+    table = np.full(pattern_size(cells, k), 255, dtype=np.uint8)
+
+    frontier = np.array([[goal.index(t) for t in tiles]], dtype=np.int16)
+    table[_rank_rows(frontier, cells)] = 0
+    level = 0
+    while len(frontier):
+        level += 1
+        next_parts = []
+        for lo in range(0, len(frontier), chunk_size):
+            block = frontier[lo:lo + chunk_size]
+            for i in range(k):
+                col = block[:, i]
+                for _, dx, dy in DIRECTIONS:
+                    if dx:
+                        valid = (col + dx * side >= 0) & (col + dx * side < cells)
+                    else:
+                        valid = (col % side + dy >= 0) & (col % side + dy < side)
+                    target = col + dx * side + dy
+                    valid &= ~(block == target[:, None]).any(axis=1)
+                    moved = block[valid]
+                    moved[:, i] = target[valid]
+                    ranks = _rank_rows(moved, cells)
+                    fresh = table[ranks] == 255
+                    ranks, first = np.unique(ranks[fresh], return_index=True)
+                    table[ranks] = level
+                    next_parts.append(moved[fresh][first])
+        frontier = np.concatenate(next_parts) if next_parts else frontier[:0]
+    return table
+
+def save_pdb(path, side, tiles, table, goal=None):
+    """Write header (magic, side, k, tiles, goal squares) followed by the raw table."""
+    goal = goal or default_goal(side)
+    k = len(tiles)
+    with open(path, "wb") as f:
+        f.write(struct.pack(f"<4sBB{k}B{k}B", PDB_MAGIC, side, k, *tiles, *(goal.index(t) for t in tiles)))
+        f.write(np.ascontiguousarray(table, dtype=np.uint8).tobytes())
+
+def load_pdb(path):
+    """
+    Memory-map a database written by save_pdb().
+
+    Returns a dict with side, tiles, squares (goal squares of the tiles) and
+    table, a read-only memoryview over the mapped bytes; the OS page cache is
+    shared by every process that maps the same file.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, side, k = struct.unpack_from("<4sBB", mm)
+    if magic != PDB_MAGIC:
+        raise ValueError(f"{path} is not a pattern database file.")
+    fields = struct.unpack_from(f"<{2 * k}B", mm, 6)
+    header = 6 + 2 * k
+    table = memoryview(mm)[header:]
+    if len(table) != pattern_size(side * side, k):
+        raise ValueError(f"{path} is truncated.")
+    return {"side": side, "tiles": fields[:k], "squares": fields[k:], "table": table}
+
+def default_pdb_paths(side, directory="."):
+    return [os.path.join(directory, f"pdb_{side}x{side}_{'-'.join(map(str, tiles))}.bin")
+            for tiles in DEFAULT_PATTERNS[side]]
+
+def ensure_default_pdbs(side, directory="."):
+    """Build and save the default databases for `side` unless already on disk."""
+    paths = default_pdb_paths(side, directory)
+    for tiles, path in zip(DEFAULT_PATTERNS[side], paths):
+        if not os.path.exists(path):
+            save_pdb(path, side, tiles, build_pdb(side, tiles))
+    return paths
+
+# ----------- IDA* -----------
+
+def ida_star(start, goal=None, pdbs=None, stats=None):
+    """
+    Iterative-deepening A* on a single mutable board.
+
+    `pdbs` is a list of databases from load_pdb() whose tile sets are
+    disjoint; without it, Manhattan distance is used. Only the database
+    holding the moved tile is re-ranked after each move.
+    Returns (path, moves) like astar_8puzzle.astar, or (None, None) for
+    unsolvable input. If a dict is passed as `stats`, stats["expanded"] and
+    stats["iterations"] are set.
+    """
+    cells = len(start)
+    side = math.isqrt(cells)
+    goal = tuple(goal or default_goal(side))
+    if not is_solvable(start, goal, side):
+        return None, None
+
+    moves_at = build_move_table(side)
+    board = list(start)
+    pos = [0] * cells
+    for i, tile in enumerate(board):
+        pos[tile] = i
+
+    if pdbs:
+        for db in pdbs:
+            if db["side"] != side or any(goal[s] != t for t, s in zip(db["tiles"], db["squares"])):
+                raise ValueError("Pattern database was built for a different board or goal.")
+        owner = [-1] * cells
+        for p, db in enumerate(pdbs):
+            for t in db["tiles"]:
+                owner[t] = p
+        tables = [db["table"] for db in pdbs]
+        groups = [db["tiles"] for db in pdbs]
+
+        def part(p):
+            return tables[p][rank_positions([pos[t] for t in groups[p]], cells)]
+
+        parts = [part(p) for p in range(len(pdbs))]
+        covered = all(o >= 0 for o in owner[1:])
+    else:
+        dist = [[0] * cells for _ in range(cells)]
+        for tile in range(1, cells):
+            gx, gy = divmod(goal.index(tile), side)
+            for sq in range(cells):
+                x, y = divmod(sq, side)
+                dist[tile][sq] = abs(x - gx) + abs(y - gy)
+        parts = [sum(dist[t][i] for i, t in enumerate(board) if t)]
+        covered = True
+
+    blank_path = [pos[0]]
+    expanded = 0
+    FOUND = -1
+
+    def search(g, h, bound, prev):
+        nonlocal expanded
+        f = g + h
+        if f > bound:
+            return f
+        if h == 0 and (covered or tuple(board) == goal):
+            return FOUND
+        expanded += 1
+        blank = blank_path[-1]
+        minimum = math.inf
+        for nb, _ in moves_at[blank]:
+            if nb == prev:
+                continue  # never undo the previous move
+            tile = board[nb]
+            board[blank], board[nb] = tile, 0
+            pos[tile], pos[0] = blank, nb
+            if pdbs:
+                p = owner[tile]
+                if p >= 0:
+                    old = parts[p]
+                    parts[p] = part(p)
+                    nh = h - old + parts[p]
+                else:
+                    nh = h
+            else:
+                nh = h - dist[tile][nb] + dist[tile][blank]
+            blank_path.append(nb)
+            t = search(g + 1, nh, bound, blank)
+            if t == FOUND:
+                return FOUND
+            blank_path.pop()
+            if pdbs and owner[tile] >= 0:
+                parts[owner[tile]] = old
+            board[blank], board[nb] = 0, tile
+            pos[tile], pos[0] = nb, blank
+            if t < minimum:
+                minimum = t
+        return minimum
+
+    h0 = sum(parts)
+    bound = h0
+    iterations = 0
+    while True:
+        iterations += 1
+        t = search(0, h0, bound, -1)
+        if t == FOUND or t == math.inf:
+            break
+        bound = t
+
+    if stats is not None:
+        stats["expanded"] = expanded
+        stats["iterations"] = iterations
+    if t != FOUND:
+        return None, None
+
+    # Replay the blank's walk to rebuild states and move names.
+    actions = {-side: "Up", side: "Down", -1: "Left", 1: "Right"}
+    state = list(start)
+    path = [tuple(state)]
+    moves = []
+    for a, b in zip(blank_path, blank_path[1:]):
+        state[a], state[b] = state[b], 0
+        path.append(tuple(state))
+        moves.append(actions[b - a])
+    return path, moves
+
+# ----------- Batch solving over a process pool -----------
+
+_worker_pdbs = []
+
+def _init_worker(pdb_paths):
+    global _worker_pdbs
+    _worker_pdbs = [load_pdb(p) for p in pdb_paths]
+
+def _solve_one(args):
+    start, goal = args
+    return ida_star(start, goal, _worker_pdbs)[1]
+
+def solve_many(puzzles, pdb_paths, goal=None, processes=None):
+    """
+    Solve many boards with IDA* in a process pool. Every worker memory-maps
+    the same database files, so the tables are shared rather than copied.
+    Returns one list of moves per puzzle (None for unsolvable ones).
+    """
+    with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(pdb_paths,)) as pool:
+        return pool.map(_solve_one, [(p, goal) for p in puzzles])
+
+# -------- Main Program with User Input --------
+
+def read_puzzle(prompt, side):
+    print(f"Enter {prompt} state ({side} rows, space-separated, use 0 for blank):")
+    puzzle = []
+    for _ in range(side):
+        puzzle.extend(map(int, input().split()))
+    return tuple(puzzle)
+
+if __name__ == "__main__":
+    side = int(input("Enter board side (3, 4 or 5): ") or "4")
+    start = read_puzzle("START", side)
+
+    print("\nLoading pattern databases (built on first use)...")
+    pdbs = [load_pdb(p) for p in ensure_default_pdbs(side)]
+
+    print("Solving...\n")
+    solution, moves = ida_star(start, default_goal(side), pdbs)
+    if solution:
+        print(f"Solution found in {len(moves)} moves:")
+        print(" ".join(moves))
+    else:
+        print("No solution exists.")
@@ -1,4 +1,6 @@
 import math
+import random
+import time
 
 # ----------- Step 1: Representing the board -----------
 board = [" " for _ in range(9)]  # 3x3 board stored as a list of 9 cells
@@ -34,42 +36,106 @@ def available_moves(brd):
             moves.append(i)        # Add its index to the list
     return moves                   # Return the final list
 # ----------- Step 3: Minimax Algorithm -----------
+# The engine works on two 9-bit bitboards (bit i set = that player owns cell i).
 
-def minimax(brd,  is_maximizing):
-    """Recursive minimax algorithm to choose the best move for AI."""
-    result = check_winner(brd)
-    if result == "O":  # AI wins
-        return 1
-    elif result == "X":  # Human wins
-        return -1
-    elif result == "Tie":
-        return 0
+WIN_MASKS = [sum(1 << i for i in pattern) for pattern in [
+    [0, 1, 2], [3, 4, 5], [6, 7, 8],
+    [0, 3, 6], [1, 4, 7], [2, 5, 8],
+    [0, 4, 8], [2, 4, 6],
+]]
+FULL_BOARD = (1 << 9) - 1
 
-    if is_maximizing:
-        best_score = -math.inf
-        for move in available_moves(brd):
-            brd[move] = "O"  # AI makes a move
-            score = minimax(brd, False)
-            brd[move] = " "  # Undo move
-            best_score = max(score, best_score)
-        return best_score
+def build_symmetry_tables():
+    """For each of the 8 board symmetries, a 512-entry table mapping a bitboard to its image."""
+    cell_maps = []
+    for rotations in range(4):
+        for mirror in (False, True):
+            mapping = []
+            for i in range(9):
+                r, c = divmod(i, 3)
+                if mirror:
+                    c = 2 - c
+                for _ in range(rotations):
+                    r, c = c, 2 - r
+                mapping.append(r * 3 + c)
+            cell_maps.append(mapping)
+    tables = []
+    for mapping in cell_maps:
+        table = []
+        for bits in range(512):
+            image = 0
+            for i in range(9):
+                if bits >> i & 1:
+                    image |= 1 << mapping[i]
+            table.append(image)
+        tables.append(table)
+    return tables
+
+SYMMETRY_TABLES = build_symmetry_tables()
+
+# Scores of canonical positions, kept for the whole game and across games
+transposition_table = {}
+
+def to_bitboards(brd):
+    """Return (ai_bits, human_bits) for a list board."""
+    ai = human = 0
+    for i, cell in enumerate(brd):
+        if cell == "O":
+            ai |= 1 << i
+        elif cell == "X":
+            human |= 1 << i
+    return ai, human
+
+def has_won(bits):
+    for mask in WIN_MASKS:
+        if bits & mask == mask:
+            return True
+    return False
+
+def canonical_key(ai, human, is_maximizing):
+    """Smallest encoding of the position over all 8 symmetries."""
+    return min(t[ai] | t[human] << 9 for t in SYMMETRY_TABLES) << 1 | is_maximizing
+
+def minimax_bits(ai, human, is_maximizing):
+    """Minimax on bitboards, memoised in transposition_table."""
+    key = canonical_key(ai, human, is_maximizing)
+    score = transposition_table.get(key)
+    if score is not None:
+        return score
+
+    if has_won(ai):  # AI wins
+        score = 1
+    elif has_won(human):  # Human wins
+        score = -1
+    elif ai | human == FULL_BOARD:  # Tie
+        score = 0
     else:
-        best_score = math.inf
-        for move in available_moves(brd):
-            brd[move] = "X"  # Human makes a move
-            score = minimax(brd, True)
-            brd[move] = " "
-            best_score = min(score, best_score)
-        return best_score
+        empty = FULL_BOARD & ~(ai | human)
+        scores = []
+        while empty:
+            move = empty & -empty
+            empty ^= move
+            if is_maximizing:
+                scores.append(minimax_bits(ai | move, human, False))
+            else:
+                scores.append(minimax_bits(ai, human | move, True))
+        score = max(scores) if is_maximizing else min(scores)
+
+    transposition_table[key] = score
+    return score
+
+def minimax(brd, is_maximizing):
+    """Minimax score of a list board (1 = AI wins, -1 = human wins, 0 = tie)."""
+    ai, human = to_bitboards(brd)
+    return minimax_bits(ai, human, is_maximizing)
 
 def best_move():
     """Find the best move for AI using minimax."""
+    ai, human = to_bitboards(board)
     best_score = -math.inf
     move_chosen = None
     for move in available_moves(board):
-        board[move] = "O"
-        score = minimax(board, False)
-        board[move] = " "
+        score = minimax_bits(ai | 1 << move, human, False)
         if score > best_score:
             best_score = score
             move_chosen = move
@@ -105,5 +171,249 @@ def play_game():
             print(f"Game Over! Result: {check_winner(board)}")
             break
 
+# ----------- Step 5: Generalized m,n,k Engine -----------
+# m rows, n columns, k in a row wins. Cells hold 0 (empty), AI or HUMAN.
+
+EMPTY, AI, HUMAN = 0, 1, 2
+WIN_SCORE = 10 ** 9
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the per-move time limit runs out."""
+
+class MNKEngine:
+    """
+    Iterative-deepening alpha-beta (negamax) for m,n,k games with:
+    - Zobrist hashing updated incrementally on every move/undo,
+    - a fixed-size transposition table (depth-preferred, older searches
+      always replaceable),
+    - killer-move and history-heuristic move ordering,
+    - an incremental evaluation over every k-cell window for positions
+      that cannot be searched to the end.
+    """
+
+    def __init__(self, m=3, n=3, k=3, tt_bits=20, seed=0):
+        self.m, self.n, self.k = m, n, k
+        self.cells = [EMPTY] * (m * n)
+        self.stones = 0
+
+        # Every line of k cells, and which lines go through each cell
+        self.windows = []
+        for r in range(m):
+            for c in range(n):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= end_r < m and 0 <= end_c < n:
+                        self.windows.append([(r + dr * i) * n + c + dc * i for i in range(k)])
+        self.cell_windows = [[] for _ in range(m * n)]
+        for w, window in enumerate(self.windows):
+            for cell in window:
+                self.cell_windows[cell].append(w)
+        self.window_counts = [[0, 0, 0] for _ in self.windows]  # index by player
+        self.window_value = [0] + [4 ** i for i in range(1, k)] + [WIN_SCORE]
+        self.score = 0  # evaluation from AI's point of view
+
+        rng = random.Random(seed)
+        self.zobrist = [[0, rng.getrandbits(64), rng.getrandbits(64)] for _ in range(m * n)]
+        self.side_key = rng.getrandbits(64)
+        self.hash = 0
+
+        self.tt_size = 1 << tt_bits
+        self.tt = [None] * self.tt_size  # (key, depth, score, flag, move, generation)
+        self.generation = 0
+
+        self.history = [0] * (m * n)
+        self.killers = []
+        self.nodes = 0
+        self.deadline = math.inf
+        self.root_move = None
+
+    # ----- board updates -----
+
+    def _window_score(self, counts):
+        if counts[AI] and not counts[HUMAN]:
+            return self.window_value[counts[AI]]
+        if counts[HUMAN] and not counts[AI]:
+            return -self.window_value[counts[HUMAN]]
+        return 0
+
+    def play(self, cell, player):
+        """Place a stone; returns True if it completes k in a row."""
+        self.cells[cell] = player
+        self.stones += 1
+        self.hash ^= self.zobrist[cell][player] ^ self.side_key
+        won = False
+        for w in self.cell_windows[cell]:
+            counts = self.window_counts[w]
+            self.score -= self._window_score(counts)
+            counts[player] += 1
+            self.score += self._window_score(counts)
+            if counts[player] == self.k:
+                won = True
+        return won
+
+    def undo(self, cell):
+        player = self.cells[cell]
+        self.cells[cell] = EMPTY
+        self.stones -= 1
+        self.hash ^= self.zobrist[cell][player] ^ self.side_key
+        for w in self.cell_windows[cell]:
+            counts = self.window_counts[w]
+            self.score -= self._window_score(counts)
+            counts[player] -= 1
+            self.score += self._window_score(counts)
+
+    def candidate_moves(self):
+        """Empty cells within two steps of a stone (every empty cell on small boards)."""
+        empties = [i for i, v in enumerate(self.cells) if v == EMPTY]
+        if self.m * self.n <= 16:
+            return empties
+        if self.stones == 0:
+            return [(self.m // 2) * self.n + self.n // 2]
+        near = []
+        for i in empties:
+            r, c = divmod(i, self.n)
+            for rr in range(max(0, r - 2), min(self.m, r + 3)):
+                row = rr * self.n
+                if any(self.cells[row + cc] for cc in range(max(0, c - 2), min(self.n, c + 3))):
+                    near.append(i)
+                    break
+        return near or empties
+
+    # ----- search -----
+
+    def minimax(self, depth, alpha, beta, player, ply):
+        """Negamax alpha-beta; scores are from `player`'s point of view."""
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        alpha_orig = alpha
+        slot = self.hash & (self.tt_size - 1)
+        entry = self.tt[slot]
+        tt_move = None
+        if entry is not None and entry[0] == self.hash:
+            tt_move = entry[4]
+            # No cutoff at the root: best_move needs root_move set every iteration.
+            if ply > 0 and entry[1] >= depth:
+                score, flag = entry[2], entry[3]
+                if flag == 0:
+                    return score
+                if flag == 1 and score >= beta:
+                    return score
+                if flag == 2 and score <= alpha:
+                    return score
+
+        if depth == 0:
+            return self.score if player == AI else -self.score
+
+        moves = self.candidate_moves()
+        if not moves:
+            return 0  # board full: tie
+
+        while len(self.killers) <= ply:
+            self.killers.append([None, None])
+        killers = self.killers[ply]
+        history = self.history
+
+        def order(move):
+            if move == tt_move:
+                return -3 * WIN_SCORE
+            if move in killers:
+                return -2 * WIN_SCORE
+            return -history[move]
+        moves.sort(key=order)
+
+        opponent = HUMAN if player == AI else AI
+        best_score = -math.inf
+        best = moves[0]
+        for move in moves:
+            try:
+                if self.play(move, player):
+                    score = WIN_SCORE - self.stones  # prefer quicker wins
+                else:
+                    score = -self.minimax(depth - 1, -beta, -alpha, opponent, ply + 1)
+            finally:
+                self.undo(move)  # also on SearchTimeout, so the board is left intact
+            if score > best_score:
+                best_score, best = score, move
+                if ply == 0:
+                    self.root_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if move != killers[0]:
+                    killers[1], killers[0] = killers[0], move
+                history[move] += depth * depth
+                break
+
+        flag = 0 if alpha_orig < best_score < beta else (1 if best_score >= beta else 2)
+        old = self.tt[slot]
+        if old is None or old[5] != self.generation or depth >= old[1]:
+            self.tt[slot] = (self.hash, depth, best_score, flag, best, self.generation)
+        return best_score
+
+    def best_move(self, time_limit=1.0, max_depth=None):
+        """Iterative deepening until `time_limit` seconds pass; returns the AI's move."""
+        self.deadline = time.perf_counter() + time_limit
+        self.generation += 1
+        self.killers = []
+        self.nodes = 0
+        empties = self.m * self.n - self.stones
+        max_depth = min(max_depth or empties, empties)
+        move_chosen = None
+        for depth in range(1, max_depth + 1):
+            self.root_move = None
+            try:
+                score = self.minimax(depth, -math.inf, math.inf, AI, 0)
+            except SearchTimeout:
+                break
+            move_chosen = self.root_move
+            if abs(score) >= WIN_SCORE - self.m * self.n:
+                break  # forced result found
+        if move_chosen is None:
+            move_chosen = self.candidate_moves()[0]
+        return move_chosen
+
+def play_mnk_game(m, n, k, time_limit=2.0):
+    """Human (X) against the m,n,k engine (O)."""
+    engine = MNKEngine(m, n, k)
+    symbols = {EMPTY: ".", AI: "O", HUMAN: "X"}
+
+    def show():
+        for r in range(m):
+            print(" ".join(symbols[engine.cells[r * n + c]] for c in range(n)))
+
+    print(f"Welcome to {m}x{n}, {k} in a row!")
+    show()
+    while True:
+        move = int(input(f"Enter your move (0-{m * n - 1}): "))
+        if not 0 <= move < m * n or engine.cells[move] != EMPTY:
+            print("Invalid move! Try again.")
+            continue
+        if engine.play(move, HUMAN):
+            show()
+            print("Game Over! Result: X")
+            break
+        if engine.stones == m * n:
+            show()
+            print("Game Over! Result: Tie")
+            break
+
+        ai_move = engine.best_move(time_limit)
+        won = engine.play(ai_move, AI)
+        print("\nAI made its move:")
+        show()
+        if won:
+            print("Game Over! Result: O")
+            break
+        if engine.stones == m * n:
+            print("Game Over! Result: Tie")
+            break
+
 # Run the game
-play_game()
+if __name__ == "__main__":
+    size = input("Enter board as m n k (press Enter for 3 3 3): ").split()
+    if size and size != ["3", "3", "3"]:
+        play_mnk_game(*map(int, size))
+    else:
+        play_game()
@@ -0,0 +1,52 @@
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dijkstras import QUEUES, csr_from_edges, dijkstra, dijkstra_csr, shortest_path
+
+
+@pytest.fixture
+def fan():
+    # a -> b (1), a -> c (10)
+    return csr_from_edges(3, [0, 0], [1, 2], [1, 10])
+
+
+@pytest.mark.parametrize("queue", ["heapq"] + sorted(QUEUES))
+def test_target_exit_clears_frontier_predecessors(fan, queue):
+    dist, pred = dijkstra_csr(fan, 0, target=1, queue=queue)
+    assert dist.tolist() == [0, 1, math.inf]
+    assert pred.tolist() == [-1, 0, -1]
+    assert shortest_path(pred, 2, 0) == []
+    assert shortest_path(pred, 1, 0) == [0, 1]
+
+
+@pytest.mark.parametrize("queue", ["heapq"] + sorted(QUEUES))
+def test_bound_exit_clears_frontier_predecessors(fan, queue):
+    dist, pred = dijkstra_csr(fan, 0, max_distance=5, queue=queue)
+    assert dist.tolist() == [0, 1, math.inf]
+    assert pred.tolist() == [-1, 0, -1]
+    assert shortest_path(pred, 2, 0) == []
+
+
+def test_full_run_keeps_predecessors(fan):
+    dist, pred = dijkstra_csr(fan, 0)
+    assert np.array_equal(pred, [-1, 0, 0])
+    assert shortest_path(pred, 2, 0) == [0, 2]
+
+
+def test_dict_target_exit_drops_tentative_entries():
+    graph = {"a": [("b", 1), ("c", 10)], "b": [("c", 1)], "c": []}
+    distances, pred = dijkstra(graph, "a", target="b")
+    assert distances == {"a": 0, "b": 1, "c": math.inf}
+    assert "c" not in pred
+    assert shortest_path(pred, "c") == []
+    assert shortest_path(pred, "b") == ["a", "b"]
+
+    distances, pred = dijkstra(graph, "a")
+    assert distances["c"] == 2
+    assert shortest_path(pred, "c") == ["a", "b", "c"]
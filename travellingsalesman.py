@@ -1,5 +1,12 @@
+import math
+import multiprocessing
+import random
+import time
+from collections import deque
 from itertools import permutations
 
+import numpy as np
+
 def read_input():
     # Step 1: Number of cities
     n = int(input("Enter the number of cities: "))
@@ -29,7 +36,11 @@ def read_input():
     start_city_index = city_names.index(start_city_name)
     return graph, city_names, start_city_index
 
-def tsp_brute_force(graph, city_names, start):
+def tsp_brute_force(graph, city_names, start, stats=None):
+    """
+    Try every ordering of the other cities. If a dict is passed as `stats`,
+    stats["permutations"] is set to the number of tours costed.
+    """
     n = len(graph)
     cities = list(range(n))
     cities.remove(start)
@@ -54,14 +65,439 @@ def tsp_brute_force(graph, city_names, start):
             min_cost = current_cost
             min_path = path
 
+    if stats is not None:
+        stats["permutations"] = math.factorial(len(cities))
+
     # Convert numeric path to city name path
     named_path = [city_names[i] for i in min_path]
     return named_path, min_cost
 
-# --- Main Program ---
-graph, city_names, start_city = read_input()
-path, cost = tsp_brute_force(graph, city_names, start_city)
+def tsp_held_karp(graph, city_names, start, chunk_size=1 << 16, stats=None):
+    """
+    Exact Held-Karp dynamic programming in O(n^2 * 2^n) time.
+
+    dp[mask, j] is the cheapest path that leaves `start`, visits exactly the
+    cities in `mask` (a bitmask over the non-start cities) and ends at city j.
+    Subsets are processed layer by layer (by number of cities), and each layer
+    is relaxed with NumPy in chunks of `chunk_size` masks. Memory is
+    2^(n-1) * (n-1) cost entries plus one byte per entry for parent pointers,
+    so 20-22 cities fit comfortably in RAM.
+
+    Integer matrices whose tour cost could overflow int32 are relaxed in
+    float64, which is exact only up to 2^53; the cost is still returned as
+    an int, like the brute-force solver.
+
+    If a dict is passed as `stats`, stats["cells"] is set to the number of
+    dp entries filled.
+    """
+    dist = np.asarray(graph)
+    n = len(dist)
+    others = [c for c in range(n) if c != start]
+    m = len(others)
+
+    if m == 0:
+        if stats is not None:
+            stats["cells"] = 0
+        return [city_names[start], city_names[start]], graph[start][start]
+
+    # Integer matrices whose tour cost fits in int32 use half the memory.
+    integral = np.issubdtype(dist.dtype, np.integer)
+    if integral and int(np.abs(dist).max()) * (n + 1) < (1 << 30):
+        dtype = np.int32
+        inf = np.int32((1 << 31) - 1 - (1 << 30))
+    else:
+        dtype = np.float64
+        inf = np.inf
+    dist = dist.astype(dtype)
+
+    sub = dist[np.ix_(others, others)]      # sub[i, j]: other i -> other j
+    from_start = dist[start, others]
+    to_start = dist[others, start]
+
+    size = 1 << m
+    dp = np.full((size, m), inf, dtype=dtype)
+    parent = np.zeros((size, m), dtype=np.uint8)
+    for j in range(m):
+        dp[1 << j, j] = from_start[j]
+    cells = m
+
+    # Group masks by popcount so every layer only reads the finished one before it.
+    masks = np.arange(size, dtype=np.int64)
+    popcount = np.zeros(size, dtype=np.uint8)
+    for b in range(m):
+        popcount += ((masks >> b) & 1).astype(np.uint8)
+    order = np.argsort(popcount, kind="stable")
+    bounds = np.cumsum(np.bincount(popcount, minlength=m + 1))
+    del masks, popcount
+
+    for k in range(2, m + 1):
+        layer = order[bounds[k - 1]:bounds[k]]
+        for j in range(m):
+            sel = layer[(layer >> j) & 1 == 1]
+            cells += len(sel)
+            for lo in range(0, len(sel), chunk_size):
+                cur = sel[lo:lo + chunk_size]
+                cand = dp[cur ^ (1 << j)] + sub[:, j]
+                best = cand.argmin(axis=1)
+                dp[cur, j] = cand[np.arange(len(cur)), best]
+                parent[cur, j] = best
+
+    full = size - 1
+    closing = dp[full] + to_start
+    last = int(closing.argmin())
+    min_cost = closing[last].item()
+    if integral:
+        min_cost = int(min_cost)
+    if stats is not None:
+        stats["cells"] = cells
+
+    # Walk parent pointers back from the full set.
+    order_back = []
+    mask = full
+    j = last
+    while mask:
+        order_back.append(others[j])
+        prev = int(parent[mask, j])
+        mask ^= 1 << j
+        j = prev
+    min_path = [start] + order_back[::-1] + [start]
+
+    named_path = [city_names[i] for i in min_path]
+    return named_path, min_cost
+
+# ----------- Heuristic solver for large instances -----------
+
+def _make_distance(graph, coords):
+    """Return a scalar distance function d(i, j) and the number of cities."""
+    if coords is not None:
+        pts = [tuple(p) for p in np.asarray(coords, dtype=np.float64).tolist()]
+        return (lambda i, j: math.dist(pts[i], pts[j])), len(pts)
+    dist = np.asarray(graph, dtype=np.float64)
+    return dist.item, len(dist)
+
+def _row_distances(graph, coords, rows):
+    """Distances from the cities in `rows` to every city, as a (len(rows), n) block."""
+    if coords is None:
+        return np.array(np.asarray(graph, dtype=np.float64)[rows])
+    pts = np.asarray(coords, dtype=np.float64)
+    sq = np.einsum("ij,ij->i", pts, pts)
+    block = sq[rows, None] + sq[None, :] - 2.0 * (pts[rows] @ pts.T)
+    np.maximum(block, 0.0, out=block)
+    return np.sqrt(block)
+
+def candidate_lists(graph=None, coords=None, k=10):
+    """
+    For every city, the indices of its k nearest other cities sorted by distance.
+    Rows are computed in chunks so only an (n, k) array is ever kept.
+    """
+    n = len(coords) if coords is not None else len(graph)
+    k = min(k, n - 1)
+    neighbors = np.empty((n, k), dtype=np.int64)
+    chunk = max(1, 4_000_000 // n)
+    for lo in range(0, n, chunk):
+        rows = np.arange(lo, min(n, lo + chunk))
+        block = _row_distances(graph, coords, rows)
+        block[np.arange(len(rows)), rows] = np.inf
+        idx = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(block, idx, axis=1), axis=1)
+        neighbors[rows] = np.take_along_axis(idx, order, axis=1)
+    return neighbors
+
+def nearest_neighbor_tour(graph, coords, neighbors, start, deadline=math.inf):
+    """Greedy nearest-neighbour tour; falls back to a full row scan only when
+    every candidate of the current city has already been visited. Past
+    `deadline`, the unvisited cities are appended in index order."""
+    n = len(neighbors)
+    visited = np.zeros(n, dtype=bool)
+    tour = [start]
+    visited[start] = True
+    cur = start
+    for step in range(n - 1):
+        if step & 255 == 0 and time.perf_counter() > deadline:
+            tour.extend(np.flatnonzero(~visited).tolist())
+            break
+        nxt = -1
+        for c in neighbors[cur]:
+            if not visited[c]:
+                nxt = int(c)
+                break
+        if nxt < 0:
+            row = _row_distances(graph, coords, [cur])[0]
+            row[visited] = np.inf
+            nxt = int(row.argmin())
+        visited[nxt] = True
+        tour.append(nxt)
+        cur = nxt
+    return np.array(tour, dtype=np.int64)
+
+def _reverse(tour, pos, i, j):
+    """Reverse the cyclic tour segment from position i to position j (inclusive),
+    or the complementary segment if that one is shorter (same cycle)."""
+    n = len(tour)
+    length = (j - i) % n + 1
+    if 2 * length > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        length = n - length
+    idx = (i + np.arange(length)) % n
+    tour[idx] = tour[idx[::-1]]
+    pos[tour[idx]] = idx
+
+def tsp_heuristic(graph, city_names, start, coords=None, time_limit=10.0, k=10, seed=None):
+    """
+    Heuristic TSP for large (symmetric) instances.
+
+    Builds a nearest-neighbour tour, then improves it with 2-opt and Or-opt
+    moves restricted to each city's k nearest neighbours, using a work queue
+    of "dirty" cities. Once a local optimum is reached, double-bridge kicks
+    keep searching until `time_limit` seconds have passed.
+
+    Pass either a dense matrix as `graph` or an (n, dim) array as `coords`
+    (Euclidean distances are then computed on demand). `city_names` may be
+    None to get city indices back.
+
+    Returns (named_path, cost, history) where history lists
+    (elapsed_seconds, best_cost) every time the best tour improved.
+    """
+    t0 = time.perf_counter()
+    deadline = t0 + time_limit
+    rng = random.Random(seed)
+    if coords is None:
+        graph = np.asarray(graph, dtype=np.float64)  # once, not per row lookup
+    d, n = _make_distance(graph, coords)
+    if city_names is None:
+        city_names = list(range(n))
+    if n <= 3:
+        path = list(range(start, n)) + list(range(start)) + [start]
+        cost = sum(d(path[i], path[i + 1]) for i in range(len(path) - 1))
+        return [city_names[i] for i in path], cost, [(0.0, cost)]
 
-# --- Output ---
-print("\nShortest path:", ' → '.join(path))
-print("Minimum cost:", cost)
+    neighbors = candidate_lists(graph, coords, k).tolist()
+    tour = nearest_neighbor_tour(graph, coords, neighbors, start, deadline)
+    pos = np.empty(n, dtype=np.int64)
+    pos[tour] = np.arange(n)
+
+    def tour_cost(t):
+        return sum(d(int(t[i - 1]), int(t[i])) for i in range(n))
+
+    def succ(c):
+        return int(tour[(pos[c] + 1) % n])
+
+    def pred(c):
+        return int(tour[pos[c] - 1])
+
+    def two_opt(a):
+        """Try a 2-opt move with a as an endpoint; return the touched cities."""
+        for forward in (True, False):
+            b = succ(a) if forward else pred(a)
+            d_ab = d(a, b)
+            for c in neighbors[a]:
+                d_ac = d(a, c)
+                if d_ac >= d_ab:
+                    break
+                e = succ(c) if forward else pred(c)
+                if c == b or e == a:
+                    continue
+                if d_ab + d(c, e) - d_ac - d(b, e) > 1e-10:
+                    if forward:     # a b ... c e  ->  a c ... b e
+                        _reverse(tour, pos, pos[b], pos[c])
+                    else:           # e c ... b a  ->  e b ... c a
+                        _reverse(tour, pos, pos[c], pos[b])
+                    return (a, b, c, e)
+        return None
+
+    def or_opt(a):
+        """Try moving the segment of 1-3 cities starting at a next to a neighbour."""
+        nonlocal tour
+        for seg_len in (1, 2, 3):
+            if n < seg_len + 3:
+                break
+            i = int(pos[a])
+            seg_pos = (i + np.arange(seg_len)) % n
+            seg = tour[seg_pos]
+            s2 = int(seg[-1])
+            p, nx = pred(a), int(tour[(i + seg_len) % n])
+            removed = d(p, a) + d(s2, nx) - d(p, nx)
+            in_seg = set(seg.tolist())
+            for c in neighbors[a]:
+                d_ac = d(a, c)
+                if d_ac >= removed:
+                    break
+                if c in in_seg:
+                    continue
+                sc, pc = succ(c), pred(c)
+                # c a..s2 sc
+                if c != p and removed - (d_ac + d(s2, sc) - d(c, sc)) > 1e-10:
+                    rest = np.delete(tour, seg_pos)
+                    at = int(np.flatnonzero(rest == c)[0]) + 1
+                    tour = np.concatenate((rest[:at], seg, rest[at:]))
+                # pc s2..a c
+                elif c != nx and removed - (d_ac + d(pc, s2) - d(pc, c)) > 1e-10:
+                    rest = np.delete(tour, seg_pos)
+                    at = int(np.flatnonzero(rest == c)[0])
+                    tour = np.concatenate((rest[:at], seg[::-1], rest[at:]))
+                else:
+                    continue
+                pos[tour] = np.arange(n)
+                return (a, s2, p, nx, c, sc, pc)
+        return None
+
+    def local_search(queue):
+        queued = set(queue)
+        while queue and time.perf_counter() < deadline:
+            a = queue.popleft()
+            queued.discard(a)
+            touched = two_opt(a) or or_opt(a)
+            if touched:
+                for c in touched:
+                    if c not in queued:
+                        queued.add(c)
+                        queue.append(c)
+
+    local_search(deque(tour.tolist()))
+    best_cost = tour_cost(tour)
+    best_tour = tour.copy()
+    history = [(time.perf_counter() - t0, best_cost)]
+
+    # Iterated local search: double-bridge kick, repair, keep if better.
+    while time.perf_counter() < deadline and n >= 8:
+        cut = sorted(rng.sample(range(1, n), 3))
+        x, y, z = cut
+        tour = np.concatenate((best_tour[:x], best_tour[y:z], best_tour[x:y], best_tour[z:]))
+        pos[tour] = np.arange(n)
+        ends = {int(tour[q]) for q in (x - 1, x, y - 1, y, z - 1, z % n, n - 1, 0)}
+        local_search(deque(ends))
+        cost = tour_cost(tour)
+        if cost < best_cost - 1e-10:
+            best_cost = cost
+            best_tour = tour.copy()
+            history.append((time.perf_counter() - t0, best_cost))
+
+    # Rotate so the tour starts and ends at `start`.
+    path = np.roll(best_tour, -int(np.flatnonzero(best_tour == start)[0])).tolist()
+    path.append(start)
+    named_path = [city_names[i] for i in path]
+    return named_path, best_cost, history
+
+# ----------- Parallel branch and bound -----------
+
+# Per-process search state, filled in by _bb_init in every pool worker.
+_bb = {}
+
+def _bb_init(dist, start, best):
+    _bb["dist"] = dist
+    _bb["sym"] = [[min(a, b) for a, b in zip(row, col)] for row, col in zip(dist, zip(*dist))]
+    _bb["start"] = start
+    _bb["best"] = best
+    _bb["mst"] = {}
+
+def _mst_weight(mask):
+    """
+    Weight of the minimum spanning tree (Prim) over the cities in `mask` plus
+    the start city, on the symmetric min(d[i][j], d[j][i]) matrix. Cached per
+    worker since many branches share the same remaining set.
+    """
+    cache = _bb["mst"]
+    if mask in cache:
+        return cache[mask]
+    sym = _bb["sym"]
+    start = _bb["start"]
+    nodes = [c for c in range(len(sym)) if mask >> c & 1]
+    key = {c: sym[start][c] for c in nodes}
+    total = 0
+    while key:
+        c = min(key, key=key.get)
+        total += key.pop(c)
+        row = sym[c]
+        for o in key:
+            if row[o] < key[o]:
+                key[o] = row[o]
+    if len(cache) < 1 << 20:
+        cache[mask] = total
+    return total
+
+def _bb_search(prefix):
+    """Depth-first branch and bound below one tour prefix; returns the best
+    (cost, path) found in this shard or None if nothing beat the shared bound."""
+    dist, sym, start, best = _bb["dist"], _bb["sym"], _bb["start"], _bb["best"]
+    n = len(dist)
+    found = None
+
+    def dfs(path, remaining, cost):
+        nonlocal found
+        last = path[-1]
+        if not remaining:
+            total = cost + dist[last][start]
+            if total < best.value:
+                with best.get_lock():
+                    if total < best.value:
+                        best.value = total
+                found = (total, path + [start])
+            return
+        # Lower bound: cheapest edge out of `last` + MST(remaining + start).
+        cities = [c for c in range(n) if remaining >> c & 1]
+        bound = cost + min(sym[last][c] for c in cities) + _mst_weight(remaining)
+        if bound >= best.value:
+            return
+        for c in sorted(cities, key=dist[last].__getitem__):
+            dfs(path + [c], remaining & ~(1 << c), cost + dist[last][c])
+
+    path = [start]
+    cost = 0
+    remaining = ((1 << n) - 1) & ~(1 << start)
+    for c in prefix:
+        cost += dist[path[-1]][c]
+        path.append(c)
+        remaining &= ~(1 << c)
+    dfs(path, remaining, cost)
+    return found
+
+def tsp_branch_and_bound(graph, city_names, start, processes=None, split_depth=2, seed_time=0.5):
+    """
+    Exact TSP by depth-first branch and bound.
+
+    Partial tours are pruned with cost + (cheapest edge leaving the last city)
+    + (MST over the unvisited cities and the start), and the upper bound is
+    seeded from a short tsp_heuristic run. The tree is split into one task per
+    ordering of the first `split_depth` cities after the start, and the tasks
+    run on a multiprocessing pool that shares the best cost found so far, so
+    every worker prunes against the global incumbent.
+    """
+    dist = [[float(x) for x in row] for row in graph]
+    n = len(dist)
+    if n <= 3:
+        return tsp_brute_force(graph, city_names, start)
+
+    named_path, _, _ = tsp_heuristic(graph, list(range(n)), start, time_limit=seed_time)
+    best_path = named_path
+    best = multiprocessing.Value("d", sum(dist[a][b] for a, b in zip(best_path, best_path[1:])))
+
+    others = [c for c in range(n) if c != start]
+    prefixes = list(permutations(others, min(split_depth, n - 2)))
+
+    if processes == 1:
+        _bb_init(dist, start, best)
+        results = map(_bb_search, prefixes)
+        shards = [r for r in results if r]
+    else:
+        with multiprocessing.Pool(processes, initializer=_bb_init, initargs=(dist, start, best)) as pool:
+            shards = [r for r in pool.imap_unordered(_bb_search, prefixes) if r]
+
+    if shards:
+        best_path = min(shards)[1]
+    min_cost = sum(graph[a][b] for a, b in zip(best_path, best_path[1:]))
+    return [city_names[i] for i in best_path], min_cost
+
+def main():
+    graph, city_names, start_city = read_input()
+    if len(graph) <= 20:
+        path, cost = tsp_held_karp(graph, city_names, start_city)
+    else:
+        path, cost, _ = tsp_heuristic(graph, city_names, start_city)
+
+    # --- Output ---
+    print("\nShortest path:", ' → '.join(path))
+    print("Minimum cost:", cost)
+
+# --- Main Program ---
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,248 @@
 from collections import deque
+from math import gcd
 
-def can_measure_water_bfs(A, B, C):
+def can_measure_water_bfs(A, B, C, stats=None):
+    """
+    BFS over (a, b) jug states. If a dict is passed as `stats`,
+    stats["expanded"] is set to the number of states dequeued.
+    """
+    if stats is not None:
+        stats["expanded"] = 0
     if C > A + B:
         return False
 
-    visited = set()
+    visited = {(0, 0)}
     q = deque()
     q.append((0, 0))  # Start from empty jugs
 
     while q:
         a, b = q.popleft()
+        if stats is not None:
+            stats["expanded"] += 1
         if a == C or b == C or a + b == C:
             return True
 
-        if (a, b) in visited:
-            continue
-        visited.add((a, b))
+        pour_ab = min(a, B - b)
+        pour_ba = min(b, A - a)
+        # Possible states: fill A, fill B, empty A, empty B, pour A → B, pour B → A
+        for state in ((A, b), (a, B), (0, b), (a, 0),
+                      (a - pour_ab, b + pour_ab), (a + pour_ba, b - pour_ba)):
+            if state not in visited:  # check before enqueueing, no duplicates
+                visited.add(state)
+                q.append(state)
 
-        # Possible states:
-        q.append((A, b))             # Fill Jug A
-        q.append((a, B))             # Fill Jug B
-        q.append((0, b))             # Empty Jug A
-        q.append((a, 0))             # Empty Jug B
+    return False
 
-        # Pour A → B
-        pour = min(a, B - b)
-        q.append((a - pour, b + pour))
+# ----------- Number-theoretic fast path -----------
 
-        # Pour B → A
-        pour = min(b, A - a)
-        q.append((a + pour, b - pour))
+def can_measure_water(A, B, C):
+    """
+    O(log) decision: C is measurable iff C <= A + B and gcd(A, B) divides C
+    (Bezout: every reachable amount is x*A + y*B for integers x, y).
+    """
+    if C > A + B:
+        return False
+    if C == 0:
+        return True
+    return C % gcd(A, B) == 0
+
+def _pour_steps(sizes, src, dst, C):
+    """Fill src, pour src → dst, empty dst when full, until C is measured."""
+    amounts = [0, 0]
+    while not (C in amounts or sum(amounts) == C):
+        if amounts[src] == 0:
+            amounts[src] = sizes[src]
+            yield ("fill", src)
+        elif amounts[dst] == sizes[dst]:
+            amounts[dst] = 0
+            yield ("empty", dst)
+        else:
+            pour = min(amounts[src], sizes[dst] - amounts[dst])
+            amounts[src] -= pour
+            amounts[dst] += pour
+            yield ("pour", src, dst)
+
+def pour_plan(A, B, C):
+    """
+    Lazy sequence of operations ("fill", i), ("empty", i), ("pour", i, j)
+    (jug 0 is A, jug 1 is B) that measures C, or None if impossible.
+
+    The two classic cycles fill one jug and pour it into the other. By
+    Bezout, cycling A into B needs the x with x*A = C (mod B), and cycling
+    B into A the y with y*B = C (mod A); both come from one modular
+    inverse, and the cycle with fewer fills is used.
+    """
+    if not can_measure_water(A, B, C):
+        return None
+    if C == 0:
+        return iter(())
+    if A == 0 or B == 0:
+        return iter([("fill", 0 if A else 1)])
+    g = gcd(A, B)
+    a, b, c = A // g, B // g, C // g
+    fills_a = c * pow(a, -1, b) % b if b > 1 else 0
+    fills_b = c * pow(b, -1, a) % a if a > 1 else 0
+    if fills_a <= fills_b:
+        return _pour_steps((A, B), 0, 1, C)
+    return _pour_steps((A, B), 1, 0, C)
+
+# ----------- N-jug shortest plans -----------
+
+def _codec(capacities):
+    """pack(amounts) -> int and unpack(int) -> list, using a bit field per jug."""
+    shifts = []
+    total = 0
+    for cap in capacities:
+        shifts.append(total)
+        total += max(1, cap.bit_length())
+    masks = [(1 << max(1, cap.bit_length())) - 1 for cap in capacities]
+
+    def pack(amounts):
+        code = 0
+        for amount, shift in zip(amounts, shifts):
+            code |= amount << shift
+        return code
+
+    def unpack(code):
+        return [(code >> shift) & mask for shift, mask in zip(shifts, masks)]
+
+    return pack, unpack
+
+def _successors(capacities, amounts):
+    """(operation, new amounts) for every move that changes the state."""
+    n = len(capacities)
+    for i in range(n):
+        if amounts[i] < capacities[i]:
+            new = amounts[:]
+            new[i] = capacities[i]
+            yield ("fill", i), new
+        if amounts[i] > 0:
+            new = amounts[:]
+            new[i] = 0
+            yield ("empty", i), new
+    for i in range(n):
+        for j in range(n):
+            if i != j and amounts[i] > 0 and amounts[j] < capacities[j]:
+                pour = min(amounts[i], capacities[j] - amounts[j])
+                new = amounts[:]
+                new[i] -= pour
+                new[j] += pour
+                yield ("pour", i, j), new
+
+def _predecessors(capacities, amounts):
+    """(operation, previous amounts) for every move that leads to `amounts`."""
+    n = len(capacities)
+    for i in range(n):
+        if amounts[i] == capacities[i]:
+            for x in range(capacities[i]):
+                prev = amounts[:]
+                prev[i] = x
+                yield ("fill", i), prev
+        if amounts[i] == 0:
+            for x in range(1, capacities[i] + 1):
+                prev = amounts[:]
+                prev[i] = x
+                yield ("empty", i), prev
+    for i in range(n):
+        for j in range(n):
+            if i == j:
+                continue
+            # A pour i → j of t litres either emptied i or filled j.
+            if amounts[i] == 0 or amounts[j] == capacities[j]:
+                for t in range(1, amounts[j] + 1):
+                    if amounts[i] + t <= capacities[i]:
+                        prev = amounts[:]
+                        prev[i] += t
+                        prev[j] -= t
+                        yield ("pour", i, j), prev
+
+def shortest_plan(capacities, C=None, target=None, bidirectional=False, stats=None):
+    """
+    Fewest operations from all-empty jugs to either any jug (or the total)
+    holding C, or to the exact amounts `target`. States are packed into one
+    int each and marked visited before they are enqueued.
+    bidirectional=True (needs `target`) grows a second BFS backwards from
+    the target and joins the two frontiers where they meet.
+    Returns a list of ("fill", i) / ("empty", i) / ("pour", i, j), or None.
+    If a dict is passed as `stats`, stats["expanded"] is set to the number
+    of states whose moves were generated.
+    """
+    if stats is not None:
+        stats["expanded"] = 0
+    capacities = list(capacities)
+    pack, unpack = _codec(capacities)
+    start = pack([0] * len(capacities))
+
+    if target is not None:
+        goal = pack(list(target))
+        is_goal = goal.__eq__
+    else:
+        if C > sum(capacities):
+            return None
+        def is_goal(code):
+            amounts = unpack(code)
+            return C in amounts or sum(amounts) == C
+
+    if bidirectional:
+        if target is None:
+            raise ValueError("bidirectional search needs an exact target state")
+        return _bidirectional_plan(capacities, pack, unpack, start, goal, stats)
+
+    parent = {start: None}
+    q = deque([start])
+    while q:
+        code = q.popleft()
+        if stats is not None:
+            stats["expanded"] += 1
+        if is_goal(code):
+            plan = []
+            while parent[code] is not None:
+                code, op = parent[code]
+                plan.append(op)
+            return plan[::-1]
+        for op, new in _successors(capacities, unpack(code)):
+            new_code = pack(new)
+            if new_code not in parent:
+                parent[new_code] = (code, op)
+                q.append(new_code)
+    return None
+
+def _bidirectional_plan(capacities, pack, unpack, start, goal, stats=None):
+    forward = {start: None}    # state -> (previous state, op)
+    backward = {goal: None}    # state -> (next state, op)
+    frontiers = ([start], [goal])
+
+    meet = start if start == goal else None
+    while meet is None and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        seen, other = (forward, backward) if side == 0 else (backward, forward)
+        moves = _successors if side == 0 else _predecessors
+        next_frontier = []
+        for code in frontiers[side]:
+            if stats is not None:
+                stats["expanded"] += 1
+            for op, new in moves(capacities, unpack(code)):
+                new_code = pack(new)
+                if new_code not in seen:
+                    seen[new_code] = (code, op)
+                    next_frontier.append(new_code)
+                    if new_code in other:
+                        meet = new_code
+                        break
+            if meet is not None:
+                break
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
 
-    return False
\ No newline at end of file
+    if meet is None:
+        return None
+    plan = []
+    code = meet
+    while forward[code] is not None:
+        code, op = forward[code]
+        plan.append(op)
+    plan.reverse()
+    code = meet
+    while backward[code] is not None:
+        code, op = backward[code]
+        plan.append(op)
+    return plan